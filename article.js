@@ -4,7 +4,7 @@ let articles = [];
 
 // Función para cargar artículos desde el archivo JSON
 function loadArticles() {
-    return fetch('data/articles_metadata.json')
+    return fetch('data/articles.json')
         .then(response => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
@@ -71,10 +71,30 @@ function getIconForArticle(title, filename, category) {
 }
 
 // Función para cargar un artículo completo
-function loadArticle(article) {
-    // Usar la ruta tal como está definida (relativa al directorio raíz)
-    const filePath = article.filename;
-    
+// Ruta del sidecar del artículo (índice y tiempo de lectura precalculados por scripts/generate_article_metadata.py)
+// p. ej. articles/new-blog.md -> data/articles/new-blog.json
+function getSidecarPath(filename) {
+    return filename.replace(/^articles\//, 'data/articles/').replace(/\.md$/, '.json');
+}
+
+// Cargar el sidecar; si no existe (p. ej. en local sin build) se calcula en el navegador
+function loadSidecar(article) {
+    return fetch(getSidecarPath(article.filename))
+        .then(response => response.ok ? response.json() : null)
+        .catch(() => null);
+}
+
+// Cargar el HTML pre-renderizado por scripts/prerender_articles.py (null si no existe)
+// p. ej. articles/new-blog.md -> data/articles/new-blog.html
+function loadPrerenderedArticle(article) {
+    const fragmentPath = article.filename.replace(/^articles\//, 'data/articles/').replace(/\.md$/, '.html');
+    return fetch(fragmentPath)
+        .then(response => response.ok ? response.text() : null)
+        .catch(() => null);
+}
+
+// Renderizar el Markdown en el navegador cuando no hay HTML pre-renderizado
+function renderMarkdownArticle(filePath) {
     return fetch(filePath)
         .then(response => {
             if (!response.ok) {
@@ -86,9 +106,18 @@ function loadArticle(article) {
             if (!text || text.trim() === '') {
                 throw new Error('The file is empty');
             }
-            const htmlContent = marked.parse(text);
-            return { ...article, content: htmlContent };
-        })
+            return marked.parse(text);
+        });
+}
+
+function loadArticle(article) {
+    // Usar la ruta tal como está definida (relativa al directorio raíz)
+    const filePath = article.filename;
+    const sidecarRequest = loadSidecar(article);
+    
+    return loadPrerenderedArticle(article)
+        .then(html => html || renderMarkdownArticle(filePath))
+        .then(htmlContent => sidecarRequest.then(sidecar => ({ ...article, content: htmlContent, sidecar: sidecar })))
         .catch(error => {
             console.error(`Error al cargar ${article.filename}:`, error);
             console.error('Ruta intentada:', filePath);
@@ -160,8 +189,8 @@ function loadArticleFromURL() {
                 
                 // Generate TOC and reading time after content is rendered
                 setTimeout(() => {
-                    generateTableOfContents();
-                    displayReadingTime();
+                    generateTableOfContents(loadedArticle.sidecar);
+                    displayReadingTime(loadedArticle.sidecar);
                     setupArticleSmoothScroll();
                 }, 200);
                 
@@ -294,13 +323,25 @@ function setupReadingProgress() {
     updateProgress();
 }
 
+// Flatten the sidecar heading tree (h2 entries with their h3 children) into document order
+function flattenTableOfContents(toc) {
+    const entries = [];
+    (toc || []).forEach(entry => {
+        entries.push(entry);
+        flattenTableOfContents(entry.children).forEach(child => entries.push(child));
+    });
+    return entries;
+}
+
 // Table of Contents generator
-function generateTableOfContents() {
+// Pre-rendered headings carry the ids of the sidecar entries; other headings are numbered here
+function generateTableOfContents(sidecar = null) {
     const articleContent = document.querySelector('.article-content');
     if (!articleContent) return;
     
     const headings = articleContent.querySelectorAll('h2, h3');
     if (headings.length === 0) return;
+    const entries = new Map(flattenTableOfContents(sidecar && sidecar.toc).map(entry => [entry.id, entry]));
     
     const tocContainer = document.createElement('div');
     tocContainer.className = 'toc-container';
@@ -308,13 +349,14 @@ function generateTableOfContents() {
     const tocList = tocContainer.querySelector('.toc-list');
     
     headings.forEach((heading, index) => {
-        const id = `heading-${index}`;
+        const entry = heading.id ? entries.get(heading.id) : undefined;
+        const id = entry ? entry.id : `heading-${index}`;
         heading.id = id;
         
         const li = document.createElement('li');
         const a = document.createElement('a');
         a.href = `#${id}`;
-        a.textContent = heading.textContent;
+        a.textContent = entry ? entry.text : heading.textContent;
         a.addEventListener('click', (e) => {
             e.preventDefault();
             const target = document.getElementById(id);
@@ -355,15 +397,18 @@ function generateTableOfContents() {
     updateActiveTOC();
 }
 
-// Calculate and display reading time
-function displayReadingTime() {
+// Calculate and display reading time (precomputed in the sidecar when available)
+function displayReadingTime(sidecar = null) {
     const articleContent = document.querySelector('.article-content');
     if (!articleContent) return;
     
-    const text = articleContent.textContent || articleContent.innerText || '';
-    const wordsPerMinute = 200;
-    const words = text.split(/\s+/).length;
-    const minutes = Math.ceil(words / wordsPerMinute);
+    let minutes = sidecar ? sidecar.reading_minutes : null;
+    if (!minutes) {
+        const text = articleContent.textContent || articleContent.innerText || '';
+        const wordsPerMinute = 200;
+        const words = text.split(/\s+/).length;
+        minutes = Math.ceil(words / wordsPerMinute);
+    }
     
     const readingTimeDiv = document.createElement('div');
     readingTimeDiv.className = 'article-reading-time';
@@ -1,5 +1,5 @@
 // 1. CONFIGURACIÓN DEL BLOG MARKDOWN
-// Cargar automáticamente los artículos desde el archivo JSON de metadata
+// Cargar automáticamente los artículos desde data/articles.json (generado por scripts/generate_article_metadata.py)
 const articlesContainer = document.getElementById('articles-container');
 
 // Variable global para almacenar los artículos cargados
@@ -7,7 +7,7 @@ let articles = [];
 
 // Función para cargar artículos desde el archivo JSON
 function loadArticles() {
-    return fetch('data/articles_metadata.json')
+    return fetch('data/articles.json')
         .then(response => {
             if (!response.ok) {
                 throw new Error('Network response was not ok');
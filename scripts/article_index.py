@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Article Index - Persistent SQLite index of the published articles for generate_article_metadata.py
+One row per article with its Notion metadata, file hash, derived fields, word count and TOC,
+stored in .cache/articles.sqlite3 and rewritten only for articles whose file or metadata changed
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Any, Iterable, Optional
+
+# Configuration
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+ARTICLE_INDEX_FILE = CACHE_DIR / "articles.sqlite3"
+# Bump when the schema or the derived fields change; the index is then rebuilt
+ARTICLE_INDEX_VERSION = 4
+
+SCHEMA = """
+CREATE TABLE articles (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    file_hash TEXT NOT NULL,
+    metadata_hash TEXT NOT NULL,
+    notion_id TEXT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    icon TEXT NOT NULL,
+    category TEXT,
+    categories TEXT NOT NULL,
+    ready INTEGER,
+    published INTEGER,
+    published_date TEXT,
+    created_time TEXT,
+    last_edited_time TEXT,
+    word_count INTEGER NOT NULL,
+    reading_minutes INTEGER NOT NULL,
+    toc TEXT NOT NULL
+);
+CREATE INDEX articles_by_date ON articles (ready, published_date DESC, last_edited_time DESC);
+CREATE TABLE article_categories (
+    name TEXT NOT NULL REFERENCES articles (name) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (name, category)
+);
+CREATE INDEX article_categories_by_category ON article_categories (category);
+"""
+
+# Optional fields of an article entry in data/articles.json, in output order
+OPTIONAL_FIELDS = ["category", "published", "published_date", "ready", "created_time", "last_edited_time"]
+BOOLEAN_FIELDS = {"published", "ready"}
+
+
+class ArticleIndex:
+    """The article rows, keyed by markdown file name (e.g. "new-era.md")"""
+
+    def __init__(self, db_file: Path = ARTICLE_INDEX_FILE):
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(db_file)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != ARTICLE_INDEX_VERSION:
+            if version:
+                print(f"  🗃️  Rebuilding article index (version {version} -> {ARTICLE_INDEX_VERSION})")
+            with self.connection:
+                self.connection.execute("DROP TABLE IF EXISTS article_categories")
+                self.connection.execute("DROP TABLE IF EXISTS articles")
+                self.connection.executescript(SCHEMA)
+                self.connection.execute(f"PRAGMA user_version = {ARTICLE_INDEX_VERSION}")
+
+    def __enter__(self) -> "ArticleIndex":
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+
+    def get(self, name: str) -> Optional[sqlite3.Row]:
+        return self.connection.execute("SELECT * FROM articles WHERE name = ?", (name,)).fetchone()
+
+    def touch(self, name: str, size: int, mtime_ns: int):
+        """Record a new stat for a file whose content did not change (e.g. after a fresh checkout)"""
+        self.connection.execute("UPDATE articles SET size = ?, mtime_ns = ? WHERE name = ?", (size, mtime_ns, name))
+
+    def upsert(self, row: Dict[str, Any], categories: List[str]):
+        """Insert or replace one article row and its categories"""
+        row = dict(row, categories=json.dumps(categories, ensure_ascii=False))
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        self.connection.execute(f"INSERT OR REPLACE INTO articles ({columns}) VALUES ({placeholders})", list(row.values()))
+        self.connection.execute("DELETE FROM article_categories WHERE name = ?", (row["name"],))
+        self.connection.executemany("INSERT OR IGNORE INTO article_categories (name, category) VALUES (?, ?)",
+                                    [(row["name"], category) for category in categories])
+
+    def remove_missing(self, names: Iterable[str]) -> int:
+        """Drop rows for articles that are no longer published. Returns how many were removed."""
+        keep = set(names)
+        stale = [row["name"] for row in self.connection.execute("SELECT name FROM articles") if row["name"] not in keep]
+        self.connection.executemany("DELETE FROM articles WHERE name = ?", [(name,) for name in stale])
+        return len(stale)
+
+    def articles(self) -> List[Dict[str, Any]]:
+        """Ready articles, newest published first, in the shape of data/articles.json"""
+        rows = self.connection.execute(
+            "SELECT * FROM articles WHERE ready = 1 "
+            "ORDER BY published_date IS NULL, published_date DESC, last_edited_time DESC, name"
+        )
+        articles = []
+        for row in rows:
+            article = {
+                "filename": f"articles/{row['name']}",
+                "title": row["title"],
+                "description": row["description"],
+                "icon": row["icon"],
+            }
+            for field in OPTIONAL_FIELDS:
+                value = row[field]
+                if value is not None and (value or field in BOOLEAN_FIELDS):
+                    article[field] = bool(value) if field in BOOLEAN_FIELDS else value
+            articles.append(article)
+        return articles
+
+    def category_counts(self) -> Dict[str, int]:
+        """Number of ready articles per Notion category"""
+        rows = self.connection.execute(
+            "SELECT article_categories.category AS category, COUNT(*) AS count FROM article_categories JOIN articles USING (name) "
+            "WHERE ready = 1 GROUP BY article_categories.category ORDER BY count DESC, article_categories.category"
+        )
+        return {row["category"]: row["count"] for row in rows}
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Export Benchmark - Measures export_notion.py against fake_notion_server.py at several scales
+Each scale runs the real exporter as a subprocess on a scratch copy of scripts/, so the
+repo's articles, images and data are never touched, and reads its EXPORT_REPORT
+Reports pages/second, Notion requests per page and peak memory
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Any
+
+from fake_notion_server import FakeNotionServer, SyntheticWorkspace
+
+# Configuration
+SCRIPTS_DIR = Path(__file__).parent
+# Number of database pages per run
+BENCH_SCALES = [int(scale) for scale in os.getenv("BENCH_SCALES", "10,50,200").split(",") if scale.strip()]
+BENCH_BLOCKS = int(os.getenv("BENCH_BLOCKS", "40"))
+BENCH_DEPTH = int(os.getenv("BENCH_DEPTH", "2"))
+BENCH_IMAGES = int(os.getenv("BENCH_IMAGES", "2"))
+BENCH_LATENCY_MS = float(os.getenv("BENCH_LATENCY_MS", "20"))
+BENCH_429_RATE = float(os.getenv("BENCH_429_RATE", "0"))
+# The fake server has no real rate limit; 3 req/s would make large scales take minutes
+BENCH_RATE_LIMIT = os.getenv("BENCH_RATE_LIMIT", "100")
+# Optional JSON file for the results
+BENCH_OUTPUT = os.getenv("BENCH_OUTPUT", "").strip()
+# Exporter settings passed through unchanged (engine, workers, ...)
+PASSTHROUGH_ENV = ("EXPORT_ENGINE", "EXPORT_WORKERS", "BLOCK_FETCH_WORKERS", "IMAGE_DOWNLOAD_WORKERS", "IMAGE_VARIANTS")
+
+
+def run_scale(pages: int, workdir: Path) -> Dict[str, Any]:
+    """Export a synthetic workspace of the given size once and collect its numbers"""
+    workspace = SyntheticWorkspace(pages, BENCH_BLOCKS, BENCH_DEPTH, BENCH_IMAGES)
+    server = FakeNotionServer(workspace, latency_ms=BENCH_LATENCY_MS, rate_429=BENCH_429_RATE).start()
+
+    root = workdir / f"scale-{pages}"
+    shutil.copytree(SCRIPTS_DIR, root / "scripts", ignore=shutil.ignore_patterns("__pycache__"))
+    report_file = root / "export_report.json"
+    env = {name: value for name, value in os.environ.items() if name in PASSTHROUGH_ENV or not name.startswith(("EXPORT_", "NOTION_", "IMAGE_"))}
+    env.update({
+        "NOTION_TOKEN": "benchmark",
+        "NOTION_BASE_URL": server.base_url,
+        "NOTION_RATE_LIMIT": BENCH_RATE_LIMIT,
+        "DATABASE_ID": workspace.database_id,
+        "EXPORT_REPORT": str(report_file),
+        "IMAGE_GC": "off",
+    })
+    env.pop("PAGE_ID", None)
+
+    try:
+        result = subprocess.run([sys.executable, str(root / "scripts" / "export_notion.py")], env=env, cwd=root,
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    exported = len(list((root / "articles").glob("*.md")))
+    if result.returncode != 0 or not report_file.exists():
+        print(result.stdout[-2000:])
+        raise RuntimeError(f"Export of {pages} page(s) failed with exit code {result.returncode}")
+
+    with open(report_file, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    seconds = report["total_seconds"]
+    return {
+        "pages": pages,
+        "exported": exported,
+        "seconds": seconds,
+        "pages_per_second": round(exported / seconds, 2) if seconds else None,
+        "requests_per_page": round(server.stats.get("api_requests", 0) / exported, 1) if exported else None,
+        "rate_limited": server.stats.get("rate_limited", 0),
+        "image_mb": round(server.stats.get("file_bytes", 0) / 1024 / 1024, 1),
+        "peak_memory_mb": report.get("peak_memory_mb"),
+        "stages": report.get("stages", {}),
+    }
+
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"\n{'pages':>7} {'exported':>9} {'seconds':>8} {'pages/s':>8} {'req/page':>9} {'429s':>5} {'peak MB':>8}")
+    for row in results:
+        print(f"{row['pages']:>7} {row['exported']:>9} {row['seconds']:>8.2f} {row['pages_per_second'] or 0:>8.2f} "
+              f"{row['requests_per_page'] or 0:>9.1f} {row['rate_limited']:>5} {row['peak_memory_mb'] or 0:>8.0f}")
+
+
+def main():
+    """Main function"""
+    print(f"⏱️  Export benchmark: scales {BENCH_SCALES}, {BENCH_BLOCKS} block(s)/page, depth {BENCH_DEPTH}, "
+          f"{BENCH_IMAGES} image(s)/page, {BENCH_LATENCY_MS:g} ms latency, {BENCH_429_RATE:.0%} 429s")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="export-bench-") as workdir:
+        for pages in BENCH_SCALES:
+            print(f"🏃 Exporting {pages} synthetic page(s)...")
+            results.append(run_scale(pages, Path(workdir)))
+    print_results(results)
+
+    if BENCH_OUTPUT:
+        with open(BENCH_OUTPUT, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Saved results to: {BENCH_OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
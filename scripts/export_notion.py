@@ -6,22 +6,147 @@ Exports each child page of a parent page as individual Markdown files to the art
 
 import os
 import re
+import sys
+import asyncio
 import json
 import hashlib
+import threading
+import time
+import uuid
+import httpx
 import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 from notion_client import Client
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
+from export_report import export_metrics
+
 # Configuration
 OUTPUT_DIR = Path(__file__).parent.parent / "articles"
 OUTPUT_DIR.mkdir(exist_ok=True)
 IMAGES_DIR = Path(__file__).parent.parent / "images"
 IMAGES_DIR.mkdir(exist_ok=True)
+IMAGE_INDEX_FILE = Path(__file__).parent.parent / "data" / "image_index.json"
 METADATA_FILE = Path(__file__).parent.parent / "data" / "articles_metadata.json"
 METADATA_FILE.parent.mkdir(exist_ok=True)
+MANIFEST_FILE = Path(__file__).parent.parent / "data" / "export_manifest.json"
+# Local caches that only speed up later runs (safe to delete)
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+PARENT_INDEX_FILE = CACHE_DIR / "parent_index.json"
+# Write-ahead journal and staged output of the export in progress
+EXPORT_JOURNAL_FILE = CACHE_DIR / "export_journal.jsonl"
+STAGING_DIR = CACHE_DIR / "staging"
+# Re-scan the whole workspace this often to drop pages that were deleted or moved away
+PARENT_INDEX_FULL_SCAN_DAYS = int(os.getenv("PARENT_INDEX_FULL_SCAN_DAYS", "7"))
+
+# Notion API root (scripts/fake_notion_server.py stands in for it in benchmarks)
+NOTION_BASE_URL = os.getenv("NOTION_BASE_URL", "https://api.notion.com").rstrip("/")
+# API version for the SDK and the raw HTTP calls alike. notion-client 3.x defaults to 2025-09-03,
+# where database pages have data_source_id parents and the page index fallback would find none
+NOTION_API_VERSION = "2022-06-28"
+
+# Export mode: "full" re-exports every ready page, "incremental" only new or edited ones
+EXPORT_MODE = os.getenv("EXPORT_MODE", "full").strip().lower()
+# Stop starting new pages when this many seconds are left before the budget ends (0 = no budget)
+EXPORT_TIME_BUDGET = float(os.getenv("EXPORT_TIME_BUDGET", "0"))
+# Time kept back from the budget for image downloads, variants and writing the output
+EXPORT_FINALIZE_SECONDS = float(os.getenv("EXPORT_FINALIZE_SECONDS", "60"))
+# Cost assumed for a page that has no export time recorded in the manifest yet
+DEFAULT_PAGE_SECONDS = 5.0
+# Continue an interrupted export from its journal (also: export_notion.py --resume)
+EXPORT_RESUME = os.getenv("EXPORT_RESUME", "false").strip().lower() in ("1", "true", "yes")
+
+# Number of pages exported concurrently (1 keeps the original sequential behaviour)
+EXPORT_WORKERS = max(1, int(os.getenv("EXPORT_WORKERS", "1")))
+# Notion allows an average of ~3 requests per second per integration
+NOTION_RATE_LIMIT = float(os.getenv("NOTION_RATE_LIMIT", "3"))
+# Sibling subtrees fetched concurrently while loading a page's block tree
+BLOCK_FETCH_WORKERS = max(1, int(os.getenv("BLOCK_FETCH_WORKERS", "4")))
+# Execution engine: "sync" (threads + blocking requests) or "async" (asyncio + notion_client.AsyncClient)
+EXPORT_ENGINE = os.getenv("EXPORT_ENGINE", "sync").strip().lower()
+# Parallel image downloads in the background download stage
+IMAGE_DOWNLOAD_WORKERS = max(1, int(os.getenv("IMAGE_DOWNLOAD_WORKERS", "8")))
+IMAGE_CHUNK_SIZE = 1024 * 1024
+# Write buffer for rendered markdown
+RENDER_BUFFER_SIZE = 1024 * 1024
+# Generate resized WebP/AVIF variants and emit <picture> markup (needs Pillow)
+IMAGE_VARIANTS = os.getenv("IMAGE_VARIANTS", "true").strip().lower() not in ("0", "false", "no")
+# Unreferenced files in images/ after the export: "report", "delete" or "off"
+IMAGE_GC = os.getenv("IMAGE_GC", "report").strip().lower()
+
+
+class RateLimiter:
+    """Token bucket shared by every Notion API call, across all worker threads"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _try_take(self) -> float:
+        """Take a token if one is available. Returns 0 on success, otherwise the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while (wait := self._try_take()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait, without blocking the event loop, until a request may be sent"""
+        while (wait := self._try_take()) > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for a while (used when Notion answers 429 anyway)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = self._paused_until
+
+
+notion_rate_limiter = RateLimiter(NOTION_RATE_LIMIT)
+
+
+def throttle_on_rate_limit(status_code: int, headers: Any):
+    """Pause the shared limiter when Notion reports rate limiting"""
+    if status_code == 429:
+        try:
+            retry_after = float(headers.get("Retry-After", "1"))
+        except (TypeError, ValueError):
+            retry_after = 1.0
+        print(f"  ⏳ Rate limited by Notion, pausing {retry_after:.1f}s")
+        export_metrics.count("rate_limited")
+        notion_rate_limiter.pause(retry_after)
+
+
+def _before_notion_request(request: httpx.Request):
+    notion_rate_limiter.acquire()
+    export_metrics.count_request(request.method, request.url)
+
+
+def normalize_notion_id(value: str) -> str:
+    """Dashed lowercase form of a Notion id, as the API returns it (ids are often pasted undashed from URLs)"""
+    value = value.strip()
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return value
 
 
 def get_notion_client() -> Client:
@@ -29,198 +154,606 @@ def get_notion_client() -> Client:
     notion_token = os.getenv("NOTION_TOKEN")
     if not notion_token:
         raise ValueError("NOTION_TOKEN environment variable is required")
-    return Client(auth=notion_token)
+    # Every SDK request passes through the shared rate limiter
+    http_client = httpx.Client(event_hooks={
+        "request": [_before_notion_request],
+        "response": [lambda response: throttle_on_rate_limit(response.status_code, response.headers)],
+    })
+    return Client(auth=notion_token, client=http_client, base_url=NOTION_BASE_URL, notion_version=NOTION_API_VERSION)
 
 
-def download_image(image_url: str, notion_token: str) -> Optional[str]:
-    """Download an image from Notion and save it locally. Returns the local path relative to repo root."""
-    try:
-        # Generate a unique filename based on URL hash
-        url_hash = hashlib.md5(image_url.encode()).hexdigest()[:12]
-        
-        # Try to get file extension from URL
-        parsed_url = urlparse(image_url)
-        path = unquote(parsed_url.path)
-        ext = os.path.splitext(path)[1] or '.png'
-        
-        # Clean extension (remove query params if any)
-        ext = ext.split('?')[0]
-        if ext not in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg']:
-            ext = '.png'
-        
-        filename = f"{url_hash}{ext}"
+def image_key(image_url: str, block_id: Optional[str] = None) -> str:
+    """Stable identity for an image.
+
+    Notion-hosted files come back as signed S3 URLs whose query string changes on
+    every API call, so the key is the image block id plus the unsigned object path.
+    """
+    if block_id:
+        return f"{block_id}:{unquote(urlparse(image_url).path)}"
+    return image_url
+
+
+def image_filename_for_url(image_url: str, block_id: Optional[str] = None) -> str:
+    """Local filename for a downloaded image, based on a hash of its stable key"""
+    # Generate a unique filename based on the key hash
+    key_hash = hashlib.md5(image_key(image_url, block_id).encode()).hexdigest()[:12]
+    
+    # Try to get file extension from URL
+    parsed_url = urlparse(image_url)
+    path = unquote(parsed_url.path)
+    ext = os.path.splitext(path)[1] or '.png'
+    
+    # Clean extension (remove query params if any)
+    ext = ext.split('?')[0]
+    if ext not in ['.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg']:
+        ext = '.png'
+    
+    return f"{key_hash}{ext}"
+
+
+class ImageIndex:
+    """Persistent map of stable image keys and content hashes to files in images/"""
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.keys: Dict[str, str] = {}
+        self.hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if index_file.exists():
+            try:
+                with open(index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.keys = data.get("keys", {})
+                self.hashes = data.get("hashes", {})
+            except Exception as e:
+                print(f"⚠️  Warning: Could not load image index: {e}")
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Filename already stored for a key, if the file is still on disk"""
+        with self._lock:
+            filename = self.keys.get(key)
+        if filename and (IMAGES_DIR / filename).exists():
+            return filename
+        return None
+
+    def add(self, key: str, local_path: Path) -> str:
+        """Record a downloaded file. Identical bytes already stored under another name are reused
+        and the new copy is removed. Returns the filename to reference."""
+        content_hash = file_content_hash(local_path)
+        with self._lock:
+            existing = self.hashes.get(content_hash)
+            if existing and existing != local_path.name and (IMAGES_DIR / existing).exists():
+                local_path.unlink()
+                filename = existing
+            else:
+                self.hashes[content_hash] = local_path.name
+                filename = local_path.name
+            self.keys[key] = filename
+        return filename
+
+    def save(self):
+        """Write the index next to the other export data"""
+        with self._lock:
+            data = {"keys": self.keys, "hashes": self.hashes}
+        try:
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save image index: {e}")
+
+
+image_index = ImageIndex(IMAGE_INDEX_FILE)
+
+
+def image_request_headers(image_url: str, notion_token: str) -> Dict[str, str]:
+    """HTTP headers used to download an image"""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    # For Notion-hosted images, we need to use the internal API
+    if 'notion.so' in image_url or 'notion-static.com' in image_url:
+        # Notion images may require authentication via the API
+        # Try with the token in Authorization header first
+        if notion_token:
+            headers['Authorization'] = f'Bearer {notion_token}'
+        # Also try cookie-based auth as fallback
+        if notion_token:
+            headers['Cookie'] = f'token_v2={notion_token}'
+    
+    return headers
+
+
+class ImageDownloader:
+    """Background image download stage.
+
+    Rendering asks for an image's local path and gets it immediately; the bytes are
+    fetched by a bounded thread pool with one keep-alive session per worker. Files
+    are written to a .part file that is resumed with HTTP Range and atomically
+    renamed when complete, so a killed run never leaves truncated images behind.
+    """
+
+    def __init__(self, notion_token: str, workers: int = IMAGE_DOWNLOAD_WORKERS):
+        self.notion_token = notion_token
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.pending: Dict[str, Any] = {}
+        # "images/<file>" references that must be rewritten once downloads finish
+        self.replacements: Dict[str, str] = {}
+        # References that fell back to the (expiring) Notion URL
+        self.failed: set = set()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=4))
+            self._local.session = session
+        return session
+
+    def submit(self, image_url: str, block_id: Optional[str] = None) -> str:
+        """Queue an image and return the local path (relative to repo root) it will have"""
+        key = image_key(image_url, block_id)
+        existing = image_index.lookup(key)
+        if existing:
+            return f"images/{existing}"
+        
+        filename = image_filename_for_url(image_url, block_id)
         local_path = IMAGES_DIR / filename
         
         # Skip if already downloaded
         if local_path.exists():
-            return f"images/{filename}"
-        
-        # Download the image
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        # For Notion-hosted images, we need to use the internal API
-        if 'notion.so' in image_url or 'notion-static.com' in image_url:
-            # Notion images may require authentication via the API
-            # Try with the token in Authorization header first
-            if notion_token:
-                headers['Authorization'] = f'Bearer {notion_token}'
-            # Also try cookie-based auth as fallback
-            if notion_token:
-                headers['Cookie'] = f'token_v2={notion_token}'
-        
-        response = requests.get(image_url, headers=headers, timeout=30, stream=True, allow_redirects=True)
-        response.raise_for_status()
-        
-        # Check if we got an image
-        content_type = response.headers.get('content-type', '')
-        if not content_type.startswith('image/'):
-            # If not an image, might be a redirect or error page
-            print(f"  ⚠️  Warning: URL did not return an image (content-type: {content_type})")
-            return image_url
+            return f"images/{image_index.add(key, local_path)}"
         
-        # Save the image
-        with open(local_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        print(f"  📷 Downloaded image: {filename}")
+        with self._lock:
+            if key not in self.pending:
+                self.pending[key] = self.executor.submit(self._download, image_url, key, filename)
         return f"images/{filename}"
+
+    def _download(self, image_url: str, key: str, filename: str):
+        local_path = IMAGES_DIR / filename
+        part_path = IMAGES_DIR / f"{filename}.part"
+        try:
+            headers = image_request_headers(image_url, self.notion_token)
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+            
+            with self._session().get(image_url, headers=headers, timeout=30, stream=True, allow_redirects=True) as response:
+                if response.status_code == 416:
+                    # The .part file is already complete (or stale); start over next time
+                    part_path.unlink()
+                response.raise_for_status()
+                
+                # Check if we got an image
+                content_type = response.headers.get('content-type', '')
+                if not content_type.startswith('image/'):
+                    # If not an image, might be a redirect or error page
+                    print(f"  ⚠️  Warning: URL did not return an image (content-type: {content_type})")
+                    self._fall_back(filename, image_url)
+                    return
+                
+                # The server may ignore Range and send the whole file
+                resumed = offset and response.status_code == 206
+                with open(part_path, 'ab' if resumed else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_SIZE):
+                        f.write(chunk)
+                        export_metrics.count("image_bytes", len(chunk))
+            
+            os.replace(part_path, local_path)
+            export_metrics.count("images_downloaded")
+            if resumed:
+                export_metrics.count("image_downloads_resumed")
+            stored = image_index.add(key, local_path)
+            if stored != filename:
+                with self._lock:
+                    self.replacements[f"images/{filename}"] = f"images/{stored}"
+            print(f"  📷 Downloaded image: {stored}{' (resumed)' if resumed else ''}")
+            
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not download image {image_url}: {e}")
+            export_metrics.count("image_downloads_failed")
+            self._fall_back(filename, image_url)
+
+    def _fall_back(self, filename: str, image_url: str):
+        # Point the markdown back at the original URL, as the inline downloader used to
+        with self._lock:
+            self.replacements[f"images/{filename}"] = image_url
+            self.failed.add(f"images/{filename}")
+
+    def finish(self) -> Dict[str, str]:
+        """Wait for every queued download. Returns the image references to rewrite."""
+        for future in list(self.pending.values()):
+            future.result()
+        self.executor.shutdown()
+        if self.pending:
+            print(f"📷 Image download stage finished: {len(self.pending)} image(s) processed")
+        return self.replacements
+
+
+image_downloader: Optional[ImageDownloader] = None
+_image_downloader_lock = threading.Lock()
+
+
+def download_image(image_url: str, notion_token: str, block_id: Optional[str] = None) -> Optional[str]:
+    """Queue an image on the download stage. Returns the local path relative to repo root."""
+    global image_downloader
+    with _image_downloader_lock:
+        if image_downloader is None:
+            image_downloader = ImageDownloader(notion_token)
+    return image_downloader.submit(image_url, block_id)
+
+
+def finish_image_downloads(markdown_files: List[Path]) -> set:
+    """Wait for the download stage and fix references to images that were deduplicated or failed.
+    Returns the names of the files left pointing at a Notion URL because a download failed."""
+    global image_downloader
+    if image_downloader is None:
+        return set()
+    replacements = image_downloader.finish()
+    failed = image_downloader.failed
+    image_downloader = None
+    fell_back = set()
+    if not replacements:
+        return fell_back
+    for md_file in markdown_files:
+        try:
+            content = md_file.read_text(encoding="utf-8")
+            if any(f"]({old})" in content for old in failed):
+                fell_back.add(md_file.name)
+            updated = content
+            for old, new in replacements.items():
+                updated = updated.replace(f"]({old})", f"]({new})")
+            if updated != content:
+                md_file.write_text(updated, encoding="utf-8")
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not update image references in {md_file.name}: {e}")
+    return fell_back
+
+
+def list_all_children(block_id: str, client: Client) -> Tuple[List[Dict[str, Any]], int]:
+    """List every child of a block, following next_cursor. Returns (children, request count)."""
+    children = []
+    requests_made = 0
+    cursor = None
+    
+    while True:
+        if cursor:
+            response = client.blocks.children.list(block_id=block_id, start_cursor=cursor, page_size=100)
+        else:
+            response = client.blocks.children.list(block_id=block_id, page_size=100)
+        requests_made += 1
+        
+        children.extend(response.get("results", []))
         
+        if not response.get("has_more"):
+            break
+        cursor = response.get("next_cursor")
+    
+    return children, requests_made
+
+
+class SharedContent:
+    """Content several pages can reference, fetched at most once per run.
+
+    Keys name the source: "synced:<id>" holds an original synced block's children,
+    "page:<id>" and "database:<id>" hold link_to_page summaries. Safe to share
+    between export workers; concurrent callers for one key wait for a single fetch.
+    main() creates one per run, so a long-lived watcher never serves stale content.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = {}
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._tasks: Dict[str, asyncio.Future] = {}
+
+    def _cached(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if key in self._entries:
+                export_metrics.count("shared_content_hits")
+                return True, self._entries[key]
+            return False, None
+
+    def _store(self, key: str, value: Any) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = value
+                export_metrics.count("shared_content_fetches")
+            return self._entries[key]
+
+    def put(self, key: str, value: Any):
+        """Seed an entry with something fetched anyway (e.g. a page being exported)"""
+        with self._lock:
+            self._entries.setdefault(key, value)
+
+    def get(self, key: str, fetch: Callable[[], Any]) -> Any:
+        found, value = self._cached(key)
+        if found:
+            return value
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            found, value = self._cached(key)
+            if found:
+                return value
+            return self._store(key, fetch())
+
+    async def get_async(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """get() for coroutines: fetch() returns an awaitable, shared by concurrent callers on one event loop"""
+        found, value = self._cached(key)
+        if found:
+            return value
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fetch())
+        try:
+            return self._store(key, await task)
+        finally:
+            self._tasks.pop(key, None)
+
+
+
+def synced_source_id(block: Dict[str, Any]) -> str:
+    """Id of the original synced block (a duplicate points at it, an original is its own source)"""
+    synced_from = block.get("synced_block", {}).get("synced_from") or {}
+    return synced_from.get("block_id") or block["id"]
+
+
+def page_summary(page: Dict[str, Any]) -> Dict[str, Any]:
+    """What a link_to_page block renders for a page"""
+    return {"title": get_page_title(page), "url": page.get("url")}
+
+
+def database_summary(database: Dict[str, Any]) -> Dict[str, Any]:
+    """What a link_to_page block renders for a database"""
+    return {"title": convert_rich_text_to_markdown(database.get("title", [])).strip() or "Untitled", "url": database.get("url")}
+
+
+def link_target_key(block: Dict[str, Any]) -> Optional[str]:
+    """Shared content key of a link_to_page block's target ("page:<id>" / "database:<id>")"""
+    link = block.get("link_to_page", {})
+    if link.get("type") == "page_id":
+        return f"page:{link.get('page_id')}"
+    if link.get("type") == "database_id":
+        return f"database:{link.get('database_id')}"
+    return None
+
+
+def fetch_link_summary(key: str, client: Client) -> Optional[Dict[str, Any]]:
+    """Retrieve the title and URL of a linked page or database (None if the integration can't see it)"""
+    kind, target_id = key.split(":", 1)
+    try:
+        if kind == "database":
+            return database_summary(client.databases.retrieve(database_id=target_id))
+        return page_summary(client.pages.retrieve(page_id=target_id))
     except Exception as e:
-        print(f"  ⚠️  Warning: Could not download image {image_url}: {e}")
-        # Return original URL as fallback
-        return image_url
+        print(f"  ⚠️  Warning: Could not retrieve linked {kind} {target_id}: {e}")
+        return None
+
+
+def fetch_block_children(block: Dict[str, Any], client: Client, shared_content: SharedContent) -> Tuple[List[Dict[str, Any]], int]:
+    """A block's children; synced blocks resolve to their original's whole subtree, fetched once per run"""
+    if block.get("type") != "synced_block":
+        return list_all_children(block["id"], client)
+    requests_made = []
+    
+    def fetch():
+        children, count = fetch_block_tree(synced_source_id(block), client, shared_content)
+        requests_made.append(count)
+        return children
+    
+    return shared_content.get(f"synced:{synced_source_id(block)}", fetch), sum(requests_made)
+
+
+def fetch_block_tree(page_id: str, client: Client, shared_content: Optional[SharedContent] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """Load a page's whole block tree level by level.
+
+    Every block with has_children gets its fully paginated children attached
+    under a "children" key; all blocks of one level are fetched concurrently.
+    Synced blocks and link_to_page targets go through shared_content, so content
+    reused across pages is fetched once. Returns (top-level blocks, request count).
+    Subtrees are never cached across runs: Notion does not bump a parent block's
+    last_edited_time when a nested block changes, so it cannot prove a subtree unchanged.
+    """
+    if shared_content is None:
+        shared_content = SharedContent()
+    top_level, total_requests = list_all_children(page_id, client)
+    level = top_level
+    links = []
+    
+    with ThreadPoolExecutor(max_workers=BLOCK_FETCH_WORKERS) as executor:
+        while level:
+            links.extend(block for block in level if block.get("type") == "link_to_page")
+            parents = [block for block in level if block.get("has_children") and block.get("id")]
+            next_level = []
+            for block, (children, requests_made) in zip(parents, executor.map(lambda b: fetch_block_children(b, client, shared_content), parents)):
+                block["children"] = children
+                total_requests += requests_made
+                # A synced block's subtree arrives complete
+                if block.get("type") != "synced_block":
+                    next_level.extend(children)
+            level = next_level
+        
+        keys = [link_target_key(block) for block in links]
+        summaries = executor.map(lambda key: shared_content.get(key, lambda: fetch_link_summary(key, client)) if key else None, keys)
+        for block, summary in zip(links, summaries):
+            block["linked_page"] = summary
+    
+    return top_level, total_requests
+
+
+def convert_rich_text_span(text_block: Dict[str, Any]) -> str:
+    """Convert one Notion rich text span to Markdown"""
+    text = text_block.get("plain_text", "")
+    annotations = text_block.get("annotations", {})
+    
+    # Apply formatting
+    if annotations.get("bold"):
+        text = f"**{text}**"
+    if annotations.get("italic"):
+        text = f"*{text}*"
+    if annotations.get("code"):
+        text = f"`{text}`"
+    if annotations.get("strikethrough"):
+        text = f"~~{text}~~"
+    if annotations.get("underline"):
+        text = f"<u>{text}</u>"
+    
+    # Handle links
+    if text_block.get("href"):
+        text = f"[{text}]({text_block['href']})"
+    
+    return text
 
 
 def convert_rich_text_to_markdown(rich_text: List[Dict[str, Any]]) -> str:
     """Convert Notion rich text to Markdown"""
-    result = ""
-    for text_block in rich_text:
-        text = text_block.get("plain_text", "")
-        annotations = text_block.get("annotations", {})
-        
-        # Apply formatting
-        if annotations.get("bold"):
-            text = f"**{text}**"
-        if annotations.get("italic"):
-            text = f"*{text}*"
-        if annotations.get("code"):
-            text = f"`{text}`"
-        if annotations.get("strikethrough"):
-            text = f"~~{text}~~"
-        if annotations.get("underline"):
-            text = f"<u>{text}</u>"
-        
-        # Handle links
-        if text_block.get("href"):
-            text = f"[{text}]({text_block['href']})"
-        
-        result += text
-    return result
+    return "".join(convert_rich_text_span(text_block) for text_block in rich_text)
 
 
 def convert_block_to_markdown(block: Dict[str, Any], client: Client, indent: int = 0, notion_token: str = "") -> str:
     """Convert a Notion block to Markdown"""
+    return "".join(iter_block_markdown(block, client, indent, notion_token))
+
+
+def render_block_content(block: Dict[str, Any], indent: int = 0, notion_token: str = "") -> str:
+    """Markdown for a block itself, without its nested blocks"""
+    block_type = block.get("type")
+    prefix = "  " * indent
+    content = ""
+    
+    block_data = block.get(block_type, {})
+    rich_text = block_data.get("rich_text", [])
+    text = convert_rich_text_to_markdown(rich_text)
+    
+    if block_type == "paragraph":
+        content = f"{prefix}{text}\n\n" if text else f"{prefix}\n\n"
+    
+    elif block_type == "heading_1":
+        content = f"{prefix}# {text}\n\n"
+    
+    elif block_type == "heading_2":
+        content = f"{prefix}## {text}\n\n"
+    
+    elif block_type == "heading_3":
+        content = f"{prefix}### {text}\n\n"
+    
+    elif block_type == "bulleted_list_item":
+        content = f"{prefix}- {text}\n"
+    
+    elif block_type == "numbered_list_item":
+        # Note: Numbering is simplified, actual numbering would need context
+        content = f"{prefix}1. {text}\n"
+    
+    elif block_type == "to_do":
+        checked = block_data.get("checked", False)
+        checkbox = "[x]" if checked else "[ ]"
+        content = f"{prefix}- {checkbox} {text}\n"
+    
+    elif block_type == "toggle":
+        content = f"{prefix}<details>\n{prefix}<summary>{text}</summary>\n"
+    
+    elif block_type == "code":
+        language = block_data.get("language", "")
+        code_text = "".join([rt.get("plain_text", "") for rt in rich_text])
+        content = f"{prefix}```{language}\n{code_text}\n{prefix}```\n\n"
+    
+    elif block_type == "quote":
+        content = f"{prefix}> {text}\n\n"
+    
+    elif block_type == "callout":
+        emoji = block_data.get("icon", {}).get("emoji", "💡")
+        content = f"{prefix}> {emoji} {text}\n\n"
+    
+    elif block_type == "divider":
+        content = f"{prefix}---\n\n"
+    
+    elif block_type == "image":
+        image_url = ""
+        if block_data.get("file"):
+            image_url = block_data["file"].get("url", "")
+        elif block_data.get("external"):
+            image_url = block_data["external"].get("url", "")
+        if image_url:
+            caption = convert_rich_text_to_markdown(block_data.get("caption", []))
+            # Download image and use local path
+            if notion_token:
+                local_image_path = download_image(image_url, notion_token, block.get("id"))
+                content = f"{prefix}![{caption}]({local_image_path})\n\n"
+            else:
+                # Fallback to original URL if no token
+                content = f"{prefix}![{caption}]({image_url})\n\n"
+    
+    elif block_type == "table_row":
+        # Pipes and line breaks would end the cell early
+        cells = [convert_rich_text_to_markdown(cell).replace("|", "\\|").replace("\n", "<br>") for cell in block_data.get("cells", [])]
+        content = f"{prefix}| {' | '.join(cells)} |\n"
+    
+    elif block_type == "link_to_page":
+        # Resolved by fetch_block_tree()
+        summary = block.get("linked_page")
+        if summary:
+            content = f"{prefix}[{summary['title']}]({summary['url']})\n\n" if summary.get("url") else f"{prefix}{summary['title']}\n\n"
+    
+    elif block_type in ["table", "column_list", "column", "synced_block"]:
+        # Containers: iter_block_markdown() renders their children
+        content = ""
+    
+    elif block_type == "bookmark":
+        url = block_data.get("url", "")
+        caption = convert_rich_text_to_markdown(block_data.get("caption", []))
+        content = f"{prefix}[{caption or url}]({url})\n\n"
+    
+    else:
+        # Fallback for unsupported block types
+        if text:
+            content = f"{prefix}{text}\n\n"
+    
+    return content
+
+
+def iter_block_markdown(block: Dict[str, Any], client: Client, indent: int = 0, notion_token: str = "") -> Iterator[str]:
+    """Yield the Markdown of a Notion block and its nested blocks, one fragment per block"""
     block_type = block.get("type")
     if not block_type:
-        return ""
+        return
     
     prefix = "  " * indent
-    content = ""
+    children = None
     
     try:
-        block_data = block.get(block_type, {})
-        rich_text = block_data.get("rich_text", [])
-        text = convert_rich_text_to_markdown(rich_text)
-        
-        if block_type == "paragraph":
-            content = f"{prefix}{text}\n\n" if text else f"{prefix}\n\n"
-        
-        elif block_type == "heading_1":
-            content = f"{prefix}# {text}\n\n"
-        
-        elif block_type == "heading_2":
-            content = f"{prefix}## {text}\n\n"
-        
-        elif block_type == "heading_3":
-            content = f"{prefix}### {text}\n\n"
-        
-        elif block_type == "bulleted_list_item":
-            content = f"{prefix}- {text}\n"
-        
-        elif block_type == "numbered_list_item":
-            # Note: Numbering is simplified, actual numbering would need context
-            content = f"{prefix}1. {text}\n"
-        
-        elif block_type == "to_do":
-            checked = block_data.get("checked", False)
-            checkbox = "[x]" if checked else "[ ]"
-            content = f"{prefix}- {checkbox} {text}\n"
-        
-        elif block_type == "toggle":
-            content = f"{prefix}<details>\n{prefix}<summary>{text}</summary>\n"
-        
-        elif block_type == "code":
-            language = block_data.get("language", "")
-            code_text = "".join([rt.get("plain_text", "") for rt in rich_text])
-            content = f"{prefix}```{language}\n{code_text}\n{prefix}```\n\n"
-        
-        elif block_type == "quote":
-            content = f"{prefix}> {text}\n\n"
-        
-        elif block_type == "callout":
-            emoji = block_data.get("icon", {}).get("emoji", "💡")
-            content = f"{prefix}> {emoji} {text}\n\n"
-        
-        elif block_type == "divider":
-            content = f"{prefix}---\n\n"
-        
-        elif block_type == "image":
-            image_url = ""
-            if block_data.get("file"):
-                image_url = block_data["file"].get("url", "")
-            elif block_data.get("external"):
-                image_url = block_data["external"].get("url", "")
-            if image_url:
-                caption = convert_rich_text_to_markdown(block_data.get("caption", []))
-                # Download image and use local path
-                if notion_token:
-                    local_image_path = download_image(image_url, notion_token)
-                    content = f"{prefix}![{caption}]({local_image_path})\n\n"
-                else:
-                    # Fallback to original URL if no token
-                    content = f"{prefix}![{caption}]({image_url})\n\n"
-        
-        elif block_type == "bookmark":
-            url = block_data.get("url", "")
-            caption = convert_rich_text_to_markdown(block_data.get("caption", []))
-            content = f"{prefix}[{caption or url}]({url})\n\n"
-        
-        else:
-            # Fallback for unsupported block types
-            if text:
-                content = f"{prefix}{text}\n\n"
+        content = render_block_content(block, indent, notion_token)
         
         # Handle children blocks (nested content)
         has_children = block.get("has_children", False)
         if has_children:
             block_id = block.get("id")
             if block_id:
-                children = client.blocks.children.list(block_id=block_id)
-                for child in children.get("results", []):
-                    child_content = convert_block_to_markdown(child, client, indent + 1 if block_type in ["toggle", "callout"] else indent, notion_token)
-                    content += child_content
-                
-                if block_type == "toggle":
-                    content += f"{prefix}</details>\n\n"
+                # Children are preloaded by fetch_block_tree(); fetch them here only for standalone blocks
+                children = block["children"] if "children" in block else list_all_children(block_id, client)[0]
         
     except Exception as e:
         print(f"⚠️  Warning: Error processing block {block_type}: {e}")
-        content = ""
+        return
     
-    return content
+    if content:
+        yield content
+    
+    if children is not None:
+        child_indent = indent + 1 if block_type in ["toggle", "callout"] else indent
+        for position, child in enumerate(children):
+            yield from iter_block_markdown(child, client, child_indent, notion_token)
+            if block_type == "table" and position == 0:
+                # Markdown tables always have a header row: the first row is it
+                width = block.get("table", {}).get("table_width") or len(child.get("table_row", {}).get("cells", []))
+                yield f"{prefix}|{' --- |' * width}\n"
+        
+        if block_type == "toggle":
+            yield f"{prefix}</details>\n\n"
+        elif block_type == "table":
+            yield "\n"
 
 
 def get_page_title(page: Dict[str, Any]) -> str:
@@ -240,173 +773,298 @@ def get_page_title(page: Dict[str, Any]) -> str:
     return "Untitled"
 
 
+# Reader for each Notion property type extract_property_value() understands
+PROPERTY_VALUE_READERS = {
+    "title": lambda prop_data: convert_rich_text_to_markdown(prop_data.get("title", [])).strip(),
+    "rich_text": lambda prop_data: convert_rich_text_to_markdown(prop_data.get("rich_text", [])).strip(),
+    "select": lambda prop_data: (prop_data.get("select") or {}).get("name"),
+    "multi_select": lambda prop_data: [item.get("name") for item in prop_data.get("multi_select", [])],
+    "date": lambda prop_data: (prop_data.get("date") or {}).get("start"),
+    "checkbox": lambda prop_data: prop_data.get("checkbox", False),
+    "number": lambda prop_data: prop_data.get("number"),
+    "url": lambda prop_data: prop_data.get("url"),
+    "email": lambda prop_data: prop_data.get("email"),
+    "phone_number": lambda prop_data: prop_data.get("phone_number"),
+    "created_time": lambda prop_data: prop_data.get("created_time"),
+    "last_edited_time": lambda prop_data: prop_data.get("last_edited_time"),
+}
+
+# Database properties extract_page_metadata() reads: role -> (name keyword, accepted types)
+METADATA_PROPERTIES = {
+    "category": ("category", ["select", "multi_select"]),
+    "published": ("published", ["date"]),
+    "ready": ("ready", ["checkbox"]),
+    "excerpt": ("excerpt", ["rich_text", "text"]),
+}
+
+# Database schemas (name -> {id, type, ...}) retrieved this run, and the extractors compiled from them
+# (both reset by main(), so a long-lived watcher picks up renamed or added properties)
+database_schemas: Dict[str, Dict[str, Dict[str, Any]]] = {}
+_metadata_extractors: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+
 def extract_property_value(prop_data: Dict[str, Any]) -> Any:
     """Extract value from a Notion property"""
-    prop_type = prop_data.get("type")
-    
-    if prop_type == "title":
-        rich_text = prop_data.get("title", [])
-        return convert_rich_text_to_markdown(rich_text).strip()
-    elif prop_type == "rich_text":
-        rich_text = prop_data.get("rich_text", [])
-        return convert_rich_text_to_markdown(rich_text).strip()
-    elif prop_type == "select":
-        select = prop_data.get("select")
-        return select.get("name") if select else None
-    elif prop_type == "multi_select":
-        multi_select = prop_data.get("multi_select", [])
-        return [item.get("name") for item in multi_select]
-    elif prop_type == "date":
-        date_obj = prop_data.get("date")
-        if date_obj:
-            return date_obj.get("start")
-        return None
-    elif prop_type == "checkbox":
-        return prop_data.get("checkbox", False)
-    elif prop_type == "number":
-        return prop_data.get("number")
-    elif prop_type == "url":
-        return prop_data.get("url")
-    elif prop_type == "email":
-        return prop_data.get("email")
-    elif prop_type == "phone_number":
-        return prop_data.get("phone_number")
-    elif prop_type == "created_time":
-        return prop_data.get("created_time")
-    elif prop_type == "last_edited_time":
-        return prop_data.get("last_edited_time")
-    else:
-        return None
+    reader = PROPERTY_VALUE_READERS.get(prop_data.get("type"))
+    return reader(prop_data) if reader else None
 
 
-def extract_page_metadata(page: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract metadata from a Notion database page - specifically Title, Category, Published, Excerpt"""
-    metadata = {
-        "id": page.get("id"),
-        "created_time": page.get("created_time"),
-        "last_edited_time": page.get("last_edited_time"),
-    }
-    
-    # Extract all properties
-    properties = page.get("properties", {})
-    
-    # Extract Title (from title property)
-    for prop_name, prop_data in properties.items():
-        if prop_data.get("type") == "title":
-            title = extract_property_value(prop_data)
-            if title:
-                metadata["title"] = title
-            break
-    
-    # Extract specific fields: Category, Published, Excerpt
-    for prop_name, prop_data in properties.items():
+def match_metadata_properties(schema: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """Pick the property that fills each metadata role. Returns role -> (property name, property schema)."""
+    matched = {}
+    for prop_name, prop_data in schema.items():
         prop_type = prop_data.get("type")
+        if prop_type == "title":
+            matched.setdefault("title", (prop_name, prop_data))
+            continue
         prop_lower = prop_name.lower()
-        
-        # Extract Category (can be select or multi_select)
-        if "category" in prop_lower and prop_type in ["select", "multi_select"]:
-            value = extract_property_value(prop_data)
-            if value:
-                metadata["category"] = value
-        
-        # Extract Published (date property)
-        elif "published" in prop_lower and prop_type == "date":
-            date_value = extract_property_value(prop_data)
-            if date_value:
-                metadata["published_date"] = date_value
-                metadata["published"] = True  # Mark as published if date exists
-            else:
-                metadata["published"] = False
-        
-        # Extract Ready (checkbox property) - this controls whether to export
-        elif "ready" in prop_lower and prop_type == "checkbox":
-            checkbox_value = extract_property_value(prop_data)
-            metadata["ready"] = checkbox_value
-        
-        # Extract Excerpt (rich_text or text)
-        elif "excerpt" in prop_lower and prop_type in ["rich_text", "text"]:
-            value = extract_property_value(prop_data)
-            if value:
-                metadata["excerpt"] = value
+        for role, (keyword, types) in METADATA_PROPERTIES.items():
+            if keyword in prop_lower and prop_type in types:
+                matched.setdefault(role, (prop_name, prop_data))
+                break
+    return matched
+
+
+def compile_metadata_extractor(schema: Dict[str, Dict[str, Any]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build the metadata extractor for one database.
+
+    Property names and types are matched against METADATA_PROPERTIES once, here;
+    the returned function only reads the matched properties of each page, by
+    property id (stable across renames), or by name when the schema has no ids.
+    """
+    fields = []
+    for role, (prop_name, prop_data) in match_metadata_properties(schema).items():
+        reader = PROPERTY_VALUE_READERS.get(prop_data.get("type"))
+        if reader:
+            fields.append((role, prop_data.get("id"), prop_name, reader))
     
-    # Fallback: if no title found, use get_page_title
-    if "title" not in metadata or not metadata["title"]:
-        metadata["title"] = get_page_title(page)
+    def extract(page: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = {
+            "id": page.get("id"),
+            "created_time": page.get("created_time"),
+            "last_edited_time": page.get("last_edited_time"),
+        }
+        properties = page.get("properties", {})
+        by_id = {prop_data.get("id"): prop_data for prop_data in properties.values()}
+        for role, prop_id, prop_name, reader in fields:
+            prop_data = by_id.get(prop_id) if prop_id else properties.get(prop_name)
+            if prop_data is None:
+                continue
+            value = reader(prop_data)
+            if role == "published":
+                # Mark as published if the date is set
+                metadata["published"] = bool(value)
+                if value:
+                    metadata["published_date"] = value
+            elif role == "ready":
+                # Ready controls whether the page is exported
+                metadata["ready"] = value
+            elif value:
+                metadata[role] = value
+        
+        # Fallback: if no title found, use get_page_title
+        if not metadata.get("title"):
+            metadata["title"] = get_page_title(page)
+        return metadata
     
-    return metadata
+    return extract
+
+
+def extract_page_metadata(page: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract metadata from a Notion database page - specifically Title, Category, Published, Ready, Excerpt"""
+    database_id = (page.get("parent") or {}).get("database_id")
+    extractor = _metadata_extractors.get(database_id) if database_id else None
+    if extractor is None:
+        # Without a retrieved schema, every page of a database still shares the first page's properties
+        extractor = compile_metadata_extractor(database_schemas.get(database_id) or page.get("properties", {}))
+        if database_id:
+            _metadata_extractors[database_id] = extractor
+    return extractor(page)
 
 
-def export_page_to_markdown(page_id: str, client: Client, output_path: Path, notion_token: str = "", extract_metadata: bool = False) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+def export_page_to_markdown(page_id: str, client: Client, output_path: Path, notion_token: str = "", extract_metadata: bool = False,
+                            shared_content: Optional[SharedContent] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     """Export a Notion page to Markdown file. Returns (filename, metadata) if successful, (None, None) otherwise."""
+    if shared_content is None:
+        shared_content = SharedContent()
     try:
         # Get page metadata
-        page = client.pages.retrieve(page_id=page_id)
-        page_title = get_page_title(page)
+        with export_metrics.timed("retrieve", page_id):
+            page = client.pages.retrieve(page_id=page_id)
+        shared_content.put(f"page:{page.get('id')}", page_summary(page))
+        print(f"📄 Exporting: {get_page_title(page)}")
         
-        print(f"📄 Exporting: {page_title}")
+        # Get the whole block tree (all levels, fully paginated)
+        with export_metrics.timed("fetch_blocks", page_id):
+            all_blocks, request_count = fetch_block_tree(page_id, client, shared_content)
+        print(f"  🌳 Fetched block tree in {request_count} request(s)")
         
-        # Extract metadata if requested
-        metadata = None
-        if extract_metadata:
-            metadata = extract_page_metadata(page)
-        
-        # Get all blocks
-        all_blocks = []
-        cursor = None
-        
-        while True:
-            if cursor:
-                response = client.blocks.children.list(block_id=page_id, start_cursor=cursor)
-            else:
-                response = client.blocks.children.list(block_id=page_id)
-            
-            blocks = response.get("results", [])
-            all_blocks.extend(blocks)
-            
-            if not response.get("has_more"):
-                break
-            cursor = response.get("next_cursor")
+        with export_metrics.timed("render", page_id):
+            return write_page_markdown(page, all_blocks, client, output_path, notion_token, extract_metadata)
         
-        # Convert blocks to markdown
+    except Exception as e:
+        print(f"❌ Error exporting page {page_id}: {e}")
+        import traceback
+        traceback.print_exc()
+        return None, None
+
+
+def write_page_markdown(page: Dict[str, Any], all_blocks: List[Dict[str, Any]], client: Client, output_path: Path, notion_token: str = "", extract_metadata: bool = False) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Render an already fetched page and its block tree to a Markdown file. Returns (filename, metadata)."""
+    page_id = page.get("id", "")
+    page_title = get_page_title(page)
+    
+    # Extract metadata if requested
+    metadata = None
+    if extract_metadata:
+        metadata = extract_page_metadata(page)
+    
+    # Sanitize filename
+    safe_filename = re.sub(r'[^\w\s-]', '', page_title).strip()
+    safe_filename = re.sub(r'[-\s]+', '-', safe_filename).lower()
+    if not safe_filename:
+        safe_filename = f"page-{page_id[:8]}"
+    
+    output_file = output_path / f"{safe_filename}.md"
+    
+    # Stream markdown fragments block by block into a buffered file
+    with open(output_file, "w", encoding="utf-8", buffering=RENDER_BUFFER_SIZE) as f:
         # Don't add the title as H1 if the first block is already a heading
-        markdown_content = ""
         if all_blocks and all_blocks[0].get("type") not in ["heading_1", "heading_2", "heading_3"]:
-            markdown_content = f"# {page_title}\n\n"
+            f.write(f"# {page_title}\n\n")
+            has_content = True
+        else:
+            has_content = False
         
         for block in all_blocks:
-            markdown_content += convert_block_to_markdown(block, client, notion_token=notion_token)
+            for fragment in iter_block_markdown(block, client, notion_token=notion_token):
+                f.write(fragment)
+                has_content = has_content or bool(fragment.strip())
         
         # If we didn't add a title and there's no content, add it
-        if not markdown_content.strip():
-            markdown_content = f"# {page_title}\n\n"
-        
-        # Sanitize filename
-        safe_filename = re.sub(r'[^\w\s-]', '', page_title).strip()
-        safe_filename = re.sub(r'[-\s]+', '-', safe_filename).lower()
-        if not safe_filename:
-            safe_filename = f"page-{page_id[:8]}"
-        
-        output_file = output_path / f"{safe_filename}.md"
-        
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        
-        print(f"✅ Exported to: {output_file}")
-        
-        # Add filename to metadata if available
-        if metadata:
-            metadata["filename"] = f"articles/{safe_filename}.md"
-        
-        return f"{safe_filename}.md", metadata
-        
-    except Exception as e:
-        print(f"❌ Error exporting page {page_id}: {e}")
-        import traceback
-        traceback.print_exc()
-        return None, None
+        if not has_content:
+            f.seek(0)
+            f.truncate()
+            f.write(f"# {page_title}\n\n")
+    
+    print(f"✅ Exported to: {output_file}")
+    
+    # Add filename to metadata if available
+    if metadata:
+        metadata["filename"] = f"articles/{safe_filename}.md"
+    
+    return f"{safe_filename}.md", metadata
 
 
+class ParentIndex:
+    """Locally persisted parent -> children index of every page visible to the integration.
+
+    Refreshed from search results sorted by last_edited_time (newest first): a
+    delta refresh stops at the first page older than the previous high-water mark,
+    so its cost follows the edit rate instead of the workspace size.
+    """
+
+    def __init__(self, index_file: Path = PARENT_INDEX_FILE):
+        self.index_file = index_file
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.high_water: Optional[str] = None
+        self.last_full_scan: Optional[str] = None
+        self._since: Optional[str] = None
+        self._seen = 0
+        if index_file.exists():
+            try:
+                with open(index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.pages = data.get("pages", {})
+                self.high_water = data.get("high_water")
+                self.last_full_scan = data.get("last_full_scan")
+            except Exception as e:
+                print(f"⚠️  Warning: Could not load parent index: {e}")
+
+    def full_scan_due(self) -> bool:
+        if not self.pages or not self.high_water or not self.last_full_scan:
+            return True
+        try:
+            last = datetime.fromisoformat(self.last_full_scan)
+        except ValueError:
+            return True
+        return (datetime.now() - last).days >= PARENT_INDEX_FULL_SCAN_DAYS
+
+    def begin_refresh(self) -> bool:
+        """Start a refresh. Returns True for a full scan, False for a delta scan."""
+        full_scan = self.full_scan_due()
+        self._since = None if full_scan else self.high_water
+        self._seen = 0
+        if full_scan:
+            self.pages = {}
+            self.last_full_scan = datetime.now().isoformat(timespec="seconds")
+        return full_scan
+
+    def add_search_results(self, results: List[Dict[str, Any]]) -> bool:
+        """Merge one page of search results. Returns False once results are older than the high-water mark."""
+        keep_going = True
+        for page in results:
+            page_id = page.get("id")
+            edited = page.get("last_edited_time") or ""
+            # Timestamps are minute-granular, so pages edited in the high-water minute are still merged
+            if self._since and edited < self._since:
+                keep_going = False
+                continue
+            self._seen += 1
+            if page.get("archived") or page.get("in_trash"):
+                self.pages.pop(page_id, None)
+            elif page_id:
+                self.pages[page_id] = page
+            if not self.high_water or edited > self.high_water:
+                self.high_water = edited
+        return keep_going
+
+    def finish_refresh(self, full_scan: bool):
+        kind = "Full scan" if full_scan else "Delta scan"
+        print(f"  🗂️  {kind}: {self._seen} page(s) merged, {len(self.pages)} page(s) indexed")
+        self.save()
+
+    def children(self, parent_type: str, parent_id: str) -> List[Dict[str, Any]]:
+        """Indexed pages whose parent is the given page or database"""
+        return [
+            page for page in self.pages.values()
+            if (page.get("parent") or {}).get("type") == parent_type and (page.get("parent") or {}).get(parent_type) == parent_id
+        ]
+
+    def save(self):
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump({"high_water": self.high_water, "last_full_scan": self.last_full_scan, "pages": self.pages}, f)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save parent index: {e}")
+
+
+SEARCH_PAGES_FILTER = {"property": "object", "value": "page"}
+SEARCH_NEWEST_FIRST = {"direction": "descending", "timestamp": "last_edited_time"}
+
+
+def refresh_parent_index(client: Client) -> ParentIndex:
+    """Load the parent index and bring it up to date with a (delta) search scan"""
+    index = ParentIndex()
+    full_scan = index.begin_refresh()
+    search_cursor = None
+    
+    while True:
+        kwargs = {"filter": SEARCH_PAGES_FILTER, "sort": SEARCH_NEWEST_FIRST, "page_size": 100}
+        if search_cursor:
+            kwargs["start_cursor"] = search_cursor
+        search_response = client.search(**kwargs)
+        
+        if not index.add_search_results(search_response.get("results", [])):
+            break
+        if not search_response.get("has_more"):
+            break
+        search_cursor = search_response.get("next_cursor")
+    
+    index.finish_refresh(full_scan)
+    return index
+
 
 def find_child_pages(parent_page_id: str, client: Client) -> List[str]:
     """Find all child pages of a parent page"""
@@ -415,21 +1073,7 @@ def find_child_pages(parent_page_id: str, client: Client) -> List[str]:
     try:
         # Method 1: Look for child_page blocks in the parent page
         print("🔍 Searching for child_page blocks...")
-        all_blocks = []
-        cursor = None
-        
-        while True:
-            if cursor:
-                response = client.blocks.children.list(block_id=parent_page_id, start_cursor=cursor)
-            else:
-                response = client.blocks.children.list(block_id=parent_page_id)
-            
-            blocks = response.get("results", [])
-            all_blocks.extend(blocks)
-            
-            if not response.get("has_more"):
-                break
-            cursor = response.get("next_cursor")
+        all_blocks, _ = list_all_children(parent_page_id, client)
         
         # Look for child_page blocks
         for block in all_blocks:
@@ -445,49 +1089,16 @@ def find_child_pages(parent_page_id: str, client: Client) -> List[str]:
                     except:
                         print(f"  ✓ Found child page: {child_page_id}")
         
-        # Method 2: Search for all pages and check their parent
+        # Method 2: Look the parent up in the persisted parent -> children index
         # This is useful if child pages aren't linked as blocks
         if not child_page_ids:
-            print("🔍 Searching all pages for children...")
-            search_cursor = None
-            all_pages = []
-            
-            while True:
-                if search_cursor:
-                    search_response = client.search(
-                        filter={"property": "object", "value": "page"},
-                        page_size=100,
-                        start_cursor=search_cursor
-                    )
-                else:
-                    search_response = client.search(
-                        filter={"property": "object", "value": "page"},
-                        page_size=100
-                    )
-                
-                pages = search_response.get("results", [])
-                all_pages.extend(pages)
-                
-                if not search_response.get("has_more"):
-                    break
-                search_cursor = search_response.get("next_cursor")
-            
-            # Check each page to see if it's a child of the parent
-            for page in all_pages:
-                parent = page.get("parent")
-                if parent:
-                    # Check if parent is a page and matches our parent_page_id
-                    if parent.get("type") == "page_id" and parent.get("page_id") == parent_page_id:
-                        child_page_id = page.get("id")
-                        if child_page_id and child_page_id not in child_page_ids:
-                            child_page_ids.append(child_page_id)
-                            child_title = get_page_title(page)
-                            print(f"  ✓ Found child page: {child_title}")
-                    # Also check if parent is a database (in case pages are in a database)
-                    elif parent.get("type") == "database_id":
-                        # If the parent page is a database, we might need to query it
-                        # For now, we'll skip this case
-                        pass
+            print("🔍 Looking up children in the page index...")
+            for page in refresh_parent_index(client).children("page_id", parent_page_id):
+                child_page_id = page.get("id")
+                if child_page_id and child_page_id not in child_page_ids:
+                    child_page_ids.append(child_page_id)
+                    child_title = get_page_title(page)
+                    print(f"  ✓ Found child page: {child_title}")
         
     except Exception as e:
         print(f"⚠️  Warning: Error finding child pages: {e}")
@@ -501,21 +1112,7 @@ def find_database_in_page(page_id: str, client: Client) -> Optional[str]:
     """Find a database block inside a page. Returns the database ID if found."""
     try:
         print(f"🔍 Searching for database in page: {page_id}")
-        all_blocks = []
-        cursor = None
-        
-        while True:
-            if cursor:
-                response = client.blocks.children.list(block_id=page_id, start_cursor=cursor)
-            else:
-                response = client.blocks.children.list(block_id=page_id)
-            
-            blocks = response.get("results", [])
-            all_blocks.extend(blocks)
-            
-            if not response.get("has_more"):
-                break
-            cursor = response.get("next_cursor")
+        all_blocks, _ = list_all_children(page_id, client)
         
         # Look for child_database blocks
         for block in all_blocks:
@@ -533,8 +1130,54 @@ def find_database_in_page(page_id: str, client: Client) -> Optional[str]:
         return None
 
 
-def query_database(database_id: str, client: Client) -> List[Dict[str, Any]]:
-    """Query a Notion database and return all pages"""
+NOTION_API_URL = f"{NOTION_BASE_URL}/v1"
+
+def notion_api_headers(notion_token: str) -> Dict[str, str]:
+    """Headers for raw HTTP calls to the Notion API"""
+    return {
+        "Authorization": f"Bearer {notion_token}",
+        "Notion-Version": NOTION_API_VERSION,
+        "Content-Type": "application/json"
+    }
+
+
+def retrieve_database_schema(database_id: str, notion_token: str) -> Dict[str, Dict[str, Any]]:
+    """Return the database's properties (name -> {id, type, ...}), or {} if it can't be retrieved"""
+    try:
+        notion_rate_limiter.acquire()
+        response = requests.get(f"{NOTION_API_URL}/databases/{database_id}", headers=notion_api_headers(notion_token), timeout=30)
+        export_metrics.count_request("GET", response.url)
+        throttle_on_rate_limit(response.status_code, response.headers)
+        response.raise_for_status()
+        schema = response.json().get("properties", {})
+        database_schemas[database_id] = schema
+        return schema
+    except Exception as e:
+        print(f"  ⚠️  Could not retrieve database schema: {e}")
+        return {}
+
+
+def build_database_query(schema: Dict[str, Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """Build the query body and URL params for a database.
+
+    The Ready filter and a last_edited_time sort are pushed down to Notion, and
+    filter_properties limits each page to the properties extract_page_metadata() reads.
+    """
+    payload = {
+        "page_size": 100,
+        "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}],
+    }
+    matched = match_metadata_properties(schema)
+    if "ready" in matched:
+        payload["filter"] = {"property": matched["ready"][0], "checkbox": {"equals": True}}
+    # Property ids come percent-encoded; the HTTP client encodes them again
+    params = [("filter_properties", unquote(prop_data["id"])) for _, prop_data in matched.values() if prop_data.get("id")]
+    return payload, params
+
+
+def query_database(database_id: str, client: Client) -> Tuple[List[Dict[str, Any]], bool]:
+    """Query a Notion database and return (all pages, whether the database query itself succeeded)
+    Pages found through the page index fallback may be incomplete, so callers must not prune on them"""
     pages = []
     cursor = None
     
@@ -547,23 +1190,27 @@ def query_database(database_id: str, client: Client) -> List[Dict[str, Any]]:
         if not notion_token:
             raise ValueError("NOTION_TOKEN not available for direct API call")
         
+        # Let Notion do the Ready filtering and property projection
+        base_payload, params = build_database_query(retrieve_database_schema(database_id, notion_token))
+        if "filter" in base_payload:
+            print(f"  🔍 Filtering on Ready server-side, fetching {len(params)} propert(ies)")
+        
         cursor = None
+        query_succeeded = False
         while True:
             try:
                 # Make direct POST request to Notion API
                 # Endpoint: POST https://api.notion.com/v1/databases/{database_id}/query
-                url = f"https://api.notion.com/v1/databases/{database_id}/query"
-                headers = {
-                    "Authorization": f"Bearer {notion_token}",
-                    "Notion-Version": "2022-06-28",  # Use a stable API version
-                    "Content-Type": "application/json"
-                }
+                url = f"{NOTION_API_URL}/databases/{database_id}/query"
                 
-                payload = {}
+                payload = dict(base_payload)
                 if cursor:
                     payload["start_cursor"] = cursor
                 
-                response = requests.post(url, headers=headers, json=payload, timeout=30)
+                notion_rate_limiter.acquire()
+                response = requests.post(url, headers=notion_api_headers(notion_token), params=params, json=payload, timeout=30)
+                export_metrics.count_request("POST", url)
+                throttle_on_rate_limit(response.status_code, response.headers)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -571,6 +1218,7 @@ def query_database(database_id: str, client: Client) -> List[Dict[str, Any]]:
                 pages.extend(results)
                 
                 if not data.get("has_more"):
+                    query_succeeded = True
                     break
                 cursor = data.get("next_cursor")
                 
@@ -589,69 +1237,71 @@ def query_database(database_id: str, client: Client) -> List[Dict[str, Any]]:
                 traceback.print_exc()
                 break
         
-        # If we successfully got pages using query, return them
-        if pages:
+        # If the query went through, return its pages (with the Ready filter, an empty result is a real answer)
+        if query_succeeded and (pages or "filter" in base_payload):
             print(f"  ✓ Successfully queried database using direct API call")
             print(f"✓ Found {len(pages)} page(s) in database")
-            return pages
+            return pages, True
+        pages = []
             
     except Exception as e:
         print(f"  ⚠️  Error with direct API call: {e}")
     
-    # Fallback: Use search API to find pages in the database
-    print(f"💡 Using search API as fallback to find pages in database...")
-    search_cursor = None
-    total_searched = 0
-    while True:
-        try:
-            if search_cursor:
-                search_response = client.search(
-                    filter={"property": "object", "value": "page"},
-                    page_size=100,
-                    start_cursor=search_cursor
-                )
-            else:
-                search_response = client.search(
-                    filter={"property": "object", "value": "page"},
-                    page_size=100
-                )
-            
-            search_results = search_response.get("results", [])
-            total_searched += len(search_results)
-            
-            # Filter pages that belong to this database
-            for page in search_results:
-                parent = page.get("parent", {})
-                parent_type = parent.get("type")
-                if parent_type == "database_id":
-                    parent_db_id = parent.get("database_id")
-                    # Debug: print first few database IDs found
-                    if total_searched <= 5:
-                        print(f"  🔍 Checking page '{get_page_title(page)}' - parent DB: {parent_db_id[:8]}...")
-                    if parent_db_id == database_id:
-                        pages.append(page)
-                        print(f"  ✓ Found page in database: {get_page_title(page)}")
-            
-            if not search_response.get("has_more"):
-                break
-            search_cursor = search_response.get("next_cursor")
-        except Exception as e:
-            print(f"⚠️  Error using search API: {e}")
-            import traceback
-            traceback.print_exc()
-            break
+    # Fallback: Use the page index (kept fresh from the search API) to find pages in the database
+    print(f"💡 Using page index as fallback to find pages in database...")
+    try:
+        for page in refresh_parent_index(client).children("database_id", database_id):
+            pages.append(page)
+            print(f"  ✓ Found page in database: {get_page_title(page)}")
+    except Exception as e:
+        print(f"⚠️  Error using page index: {e}")
+        import traceback
+        traceback.print_exc()
     
-    print(f"  🔍 Searched {total_searched} pages, found {len(pages)} in database")
     print(f"✓ Found {len(pages)} page(s) in database")
-    return pages
+    return pages, False
+
 
+def discover_database_pages(database_id: str, client: Client, notion_token: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """Query the database with the configured engine. Returns (pages, whether the query succeeded)."""
+    if EXPORT_ENGINE == "async":
+        import export_notion_async
+        return export_notion_async.query_database(database_id, notion_token)
+    return query_database(database_id, client)
 
-def clear_existing_articles(output_dir: Path):
-    """Remove all existing markdown files from the articles directory"""
+
+def filter_ready_pages(pages: List[Dict[str, Any]]) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Keep only pages whose Ready checkbox is checked. Returns (page ids, metadata)."""
+    page_ids = []
+    all_metadata = []
+    
+    # Always filter by Ready checkbox property - only export if Ready checkbox is checked
+    # (the database query already filters server-side; this also covers the search fallback)
+    print(f"🔍 Filtering for ready articles only (Ready checkbox = true)...")
+    for page in pages:
+        metadata = extract_page_metadata(page)
+        # Check Ready checkbox - this is what controls export
+        is_ready = metadata.get("ready", False)
+        published_date = metadata.get("published_date", None)
+        
+        # Only export if Ready checkbox is checked (true)
+        if is_ready:
+            page_ids.append(metadata.get("id"))
+            all_metadata.append(metadata)
+            print(f"  ✓ Including: {metadata.get('title', 'Untitled')} (ready={is_ready}, published_date={published_date})")
+        else:
+            print(f"  ⏭️  Skipping unready article: {metadata.get('title', 'Untitled')} (ready={is_ready})")
+    
+    print(f"✓ Found {len(page_ids)} ready article(s) to export")
+    return page_ids, all_metadata
+
+
+def clear_existing_articles(output_dir: Path, keep: Optional[set] = None):
+    """Remove existing markdown files from the articles directory, except the filenames in keep"""
     if not output_dir.exists():
         return
     
-    md_files = list(output_dir.glob("*.md"))
+    md_files = [md_file for md_file in output_dir.glob("*.md") if md_file.name not in (keep or set())]
     if md_files:
         print(f"🗑️  Removing {len(md_files)} existing article(s)...")
         for md_file in md_files:
@@ -664,12 +1314,248 @@ def clear_existing_articles(output_dir: Path):
         print("📁 No existing articles to remove")
 
 
+def file_content_hash(file_path: Path) -> Optional[str]:
+    """Return the SHA-256 hex digest of a file, or None if it cannot be read"""
+    try:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+
+def load_export_manifest() -> Dict[str, Dict[str, Any]]:
+    """Load the page id -> {last_edited_time, filename, content_hash} manifest from the previous export"""
+    if not MANIFEST_FILE.exists():
+        return {}
+    try:
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict):
+            return manifest
+    except Exception as e:
+        print(f"⚠️  Warning: Could not load export manifest: {e}")
+    return {}
+
+
+def write_json_atomic(file_path: Path, data: Any, **dump_options):
+    """Write JSON to a temporary file and rename it over file_path, so readers never see half a file"""
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_options)
+    os.replace(tmp_path, file_path)
+
+
+def save_export_manifest(manifest: Dict[str, Dict[str, Any]]):
+    """Persist the export manifest so the next run can skip unchanged pages"""
+    try:
+        write_json_atomic(MANIFEST_FILE, manifest, indent=2, ensure_ascii=False, sort_keys=True)
+        print(f"✅ Saved export manifest for {len(manifest)} page(s) to: {MANIFEST_FILE}")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not save export manifest: {e}")
+
+
+def plan_incremental_export(ready_metadata: List[Dict[str, Any]], manifest: Dict[str, Dict[str, Any]], output_dir: Path) -> Tuple[List[str], List[str]]:
+    """Compare ready pages against the manifest. Returns (page ids to export, page ids that are unchanged).
+
+    A page is unchanged when its last_edited_time matches the manifest and its
+    markdown file is still on disk with the recorded content hash. Pages flagged
+    "retry" (an image download failed) are always exported again.
+    """
+    to_export = []
+    unchanged = []
+    for metadata in ready_metadata:
+        page_id = metadata.get("id")
+        entry = manifest.get(page_id)
+        if not entry or entry.get("retry") or entry.get("last_edited_time") != metadata.get("last_edited_time"):
+            to_export.append(page_id)
+            continue
+        filename = entry.get("filename", "")
+        if not filename or file_content_hash(output_dir / filename) != entry.get("content_hash"):
+            to_export.append(page_id)
+            continue
+        unchanged.append(page_id)
+    return to_export, unchanged
+
+
+def remove_unreadied_articles(manifest: Dict[str, Dict[str, Any]], ready_ids: List[str], output_dir: Path):
+    """Delete the markdown of pages that are in the manifest but no longer ready, and drop them from the manifest"""
+    ready = set(ready_ids)
+    for page_id in [pid for pid in manifest if pid not in ready]:
+        entry = manifest.pop(page_id)
+        filename = entry.get("filename")
+        if not filename:
+            continue
+        md_file = output_dir / filename
+        try:
+            if md_file.exists():
+                md_file.unlink()
+                print(f"  🗑️  Removed unreadied article: {filename}")
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not remove {filename}: {e}")
+
+
+class ExportJournal:
+    """Write-ahead journal of the export in progress.
+
+    Pages are rendered into STAGING_DIR and each finished page is appended (and
+    fsynced) to the journal with its filename and metadata. Only when every page is
+    done are the staged files moved into articles/ and the metadata written, so an
+    interrupted run leaves the published site untouched. A --resume run reuses the
+    journaled pages instead of exporting them again.
+    """
+
+    def __init__(self, journal_file: Path = EXPORT_JOURNAL_FILE, staging_dir: Path = STAGING_DIR):
+        self.journal_file = journal_file
+        self.staging_dir = staging_dir
+        self._lock = threading.Lock()
+
+    def load(self, target: str) -> Dict[str, Dict[str, Any]]:
+        """Pages journaled by an interrupted run for the same target: page id -> {filename, metadata}"""
+        pages = {}
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return pages
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # The last line may be cut short by the crash
+                continue
+            if "target" in record and record["target"] != target:
+                return {}
+            if "page_id" in record:
+                pages[record["page_id"]] = record
+        return pages
+
+    def begin(self, target: str, resume: bool):
+        """Start a journal for this run, or keep appending to the interrupted one when resuming"""
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        if resume and self.journal_file.exists():
+            return
+        for staged in self.staging_dir.glob("*.md"):
+            staged.unlink()
+        with open(self.journal_file, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"target": target, "started": datetime.now().isoformat(timespec="seconds")}) + "\n")
+
+    def record_page(self, page_id: str, filename: str, metadata: Optional[Dict[str, Any]]):
+        with self._lock:
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"page_id": page_id, "filename": filename, "metadata": metadata}, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def finish(self):
+        """Forget the journal once its output has been swapped in"""
+        try:
+            self.journal_file.unlink()
+            for staged in self.staging_dir.glob("*"):
+                staged.unlink()
+            self.staging_dir.rmdir()
+        except OSError as e:
+            print(f"⚠️  Warning: Could not clean up the export journal: {e}")
+
+
+# Any image path referenced from exported markdown (as in gc_images.py)
+IMAGE_REF_RE = re.compile(r'images/([\w\-./]+\.\w+)')
+
+
+def resumable_pages(journaled: Dict[str, Dict[str, Any]], page_ids: List[str], metadata_map: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Journaled pages that need no new export: still unedited, output still on disk and every image it references downloaded"""
+    resumable = {}
+    for page_id in page_ids:
+        record = journaled.get(page_id)
+        if not record:
+            continue
+        metadata = record.get("metadata") or {}
+        if page_id in metadata_map and metadata.get("last_edited_time") != metadata_map[page_id].get("last_edited_time"):
+            continue
+        staged = STAGING_DIR / record["filename"]
+        # A crash while swapping leaves some pages already moved into articles/
+        output_file = staged if staged.exists() else OUTPUT_DIR / record["filename"]
+        try:
+            content = output_file.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        if all((IMAGES_DIR / ref).exists() for ref in IMAGE_REF_RE.findall(content)):
+            resumable[page_id] = record
+    return resumable
+
+
+class ExportScheduler:
+    """Orders pages by priority and stops starting new ones before the time budget runs out.
+
+    Priority: pages edited since their last export (newest edit first), then pages
+    whose markdown is missing, then the rest. Each page's cost is estimated from the
+    export time recorded in the manifest by previous runs. Once a page no longer fits
+    in the budget, no further page is started, so lower-priority pages never jump ahead.
+    """
+
+    def __init__(self, previous_manifest: Dict[str, Dict[str, Any]], budget: float = EXPORT_TIME_BUDGET, started: Optional[float] = None):
+        self.previous_manifest = previous_manifest
+        self.budget = budget
+        self.started = time.monotonic() if started is None else started
+        self.durations: Dict[str, float] = {}
+        self.deferred: List[str] = []
+        known = sorted(entry["export_seconds"] for entry in previous_manifest.values() if entry.get("export_seconds"))
+        self.default_cost = known[len(known) // 2] if known else DEFAULT_PAGE_SECONDS
+        self._lock = threading.Lock()
+
+    def order(self, page_ids: List[str], metadata_map: Dict[str, Dict[str, Any]], output_dir: Path) -> List[str]:
+        """Page ids in the order they should be exported"""
+        def priority(page_id: str) -> Tuple[int, str]:
+            entry = self.previous_manifest.get(page_id)
+            edited = metadata_map.get(page_id, {}).get("last_edited_time") or ""
+            if not entry or not (output_dir / entry.get("filename", "")).is_file():
+                tier = 1
+            elif entry.get("last_edited_time") != edited:
+                tier = 0
+            else:
+                tier = 2
+            return tier, edited
+        # Stable sorts: newest edit first within each tier, then by tier
+        ordered = sorted(page_ids, key=lambda page_id: priority(page_id)[1], reverse=True)
+        return sorted(ordered, key=lambda page_id: priority(page_id)[0])
+
+    def estimate(self, page_id: str) -> float:
+        return self.previous_manifest.get(page_id, {}).get("export_seconds") or self.default_cost
+
+    def should_start(self, page_id: str) -> bool:
+        """Whether there is still time to export this page; once one doesn't fit, the rest are deferred too"""
+        with self._lock:
+            if self.budget > 0 and not self.deferred:
+                remaining = self.budget - EXPORT_FINALIZE_SECONDS - (time.monotonic() - self.started)
+                if self.estimate(page_id) > remaining:
+                    print(f"⏰ Time budget nearly used up ({remaining:.0f}s left), deferring the remaining pages")
+                    self.deferred.append(page_id)
+                    return False
+            elif self.deferred:
+                self.deferred.append(page_id)
+                return False
+            return True
+
+    def record(self, page_id: str, seconds: float):
+        with self._lock:
+            self.durations[page_id] = round(seconds, 2)
+
+
 def main():
     """Main function"""
     print("📚 Notion Blog Exporter starting...")
+    export_metrics.mark("discover")
+    export_metrics.config.update(mode=EXPORT_MODE, engine=EXPORT_ENGINE, workers=EXPORT_WORKERS, rate_limit=NOTION_RATE_LIMIT,
+                                 block_fetch_workers=BLOCK_FETCH_WORKERS, image_download_workers=IMAGE_DOWNLOAD_WORKERS)
+    # Schemas and extractors are per run: watch_notion.py calls main() repeatedly in one process
+    database_schemas.clear()
+    _metadata_extractors.clear()
     
     # Get database ID or page ID(s) from environment variable
-    database_id = os.getenv("DATABASE_ID", "").strip()
+    # Normalized once, so they compare equal to the ids in API responses (parent.database_id, schema cache)
+    database_id = normalize_notion_id(os.getenv("DATABASE_ID", ""))
     page_ids_str = os.getenv("PAGE_ID", "").strip()
     
     # Initialize Notion client
@@ -678,38 +1564,24 @@ def main():
     
     page_ids_to_export = []
     is_database = False
+    # Whether the database query answered; pruning on an incomplete page list would delete published articles
+    discovered = False
     all_metadata = []
+    incremental = EXPORT_MODE == "incremental"
+    # The previous manifest also drives scheduling; full exports rebuild it from scratch
+    previous_manifest = load_export_manifest()
+    manifest = dict(previous_manifest) if incremental else {}
+    scheduler = ExportScheduler(previous_manifest)
+    if incremental:
+        print(f"♻️  Incremental export: {len(manifest)} page(s) in manifest")
     
     # Check if we're using a database
     if database_id:
         is_database = True
         print(f"📊 Using Notion Database: {database_id}")
-        
-        # Clear existing articles first (to remove unpublished ones)
-        clear_existing_articles(OUTPUT_DIR)
-        
-        pages = query_database(database_id, client)
-        
-        # Always filter by Ready checkbox property - only export if Ready checkbox is checked
-        print(f"🔍 Filtering for ready articles only (Ready checkbox = true)...")
-        for page in pages:
-            metadata = extract_page_metadata(page)
-            # Check Ready checkbox - this is what controls export
-            is_ready = metadata.get("ready", False)
-            published_date = metadata.get("published_date", None)
-            
-            # Only export if Ready checkbox is checked (true)
-            if is_ready:
-                page_ids_to_export.append(metadata.get("id"))
-                all_metadata.append(metadata)
-                print(f"  ✓ Including: {metadata.get('title', 'Untitled')} (ready={is_ready}, published_date={published_date})")
-            else:
-                print(f"  ⏭️  Skipping unready article: {metadata.get('title', 'Untitled')} (ready={is_ready})")
-        
-        print(f"✓ Found {len(page_ids_to_export)} ready article(s) to export")
     elif page_ids_str:
         # If PAGE_ID is provided but no DATABASE_ID, try to find database in the page
-        parent_page_id = page_ids_str.split(",")[0].strip()
+        parent_page_id = normalize_notion_id(page_ids_str.split(",")[0])
         print(f"🔍 DATABASE_ID not provided, searching for database in page: {parent_page_id}")
         found_database_id = find_database_in_page(parent_page_id, client)
         
@@ -717,33 +1589,10 @@ def main():
             is_database = True
             database_id = found_database_id
             print(f"📊 Found and using database: {database_id}")
-            
-            # Clear existing articles first (to remove unpublished ones)
-            clear_existing_articles(OUTPUT_DIR)
-            
-            pages = query_database(database_id, client)
-            
-            # Always filter by Ready checkbox property - only export if Ready checkbox is checked
-            print(f"🔍 Filtering for ready articles only (Ready checkbox = true)...")
-            for page in pages:
-                metadata = extract_page_metadata(page)
-                # Check Ready checkbox - this is what controls export
-                is_ready = metadata.get("ready", False)
-                published_date = metadata.get("published_date", None)
-                
-                # Only export if Ready checkbox is checked (true)
-                if is_ready:
-                    page_ids_to_export.append(metadata.get("id"))
-                    all_metadata.append(metadata)
-                    print(f"  ✓ Including: {metadata.get('title', 'Untitled')} (ready={is_ready}, published_date={published_date})")
-                else:
-                    print(f"  ⏭️  Skipping unready article: {metadata.get('title', 'Untitled')} (ready={is_ready})")
-            
-            print(f"✓ Found {len(page_ids_to_export)} ready article(s) to export")
         else:
             # Fall back to old behavior (child pages)
             print("⚠️  No database found, falling back to child pages method")
-            page_ids_list = [pid.strip() for pid in page_ids_str.split(",") if pid.strip()]
+            page_ids_list = [normalize_notion_id(pid) for pid in page_ids_str.split(",") if pid.strip()]
             
             if len(page_ids_list) > 1:
                 # Multiple page IDs provided - export them directly
@@ -755,7 +1604,11 @@ def main():
                 print(f"🔍 Finding child pages of parent page: {parent_page_id}")
                 
                 # Find all child pages
-                page_ids_to_export = find_child_pages(parent_page_id, client)
+                if EXPORT_ENGINE == "async":
+                    import export_notion_async
+                    page_ids_to_export = export_notion_async.find_child_pages(parent_page_id, notion_token)
+                else:
+                    page_ids_to_export = find_child_pages(parent_page_id, client)
                 
                 if not page_ids_to_export:
                     print("⚠️  No child pages found.")
@@ -764,28 +1617,110 @@ def main():
     else:
         raise ValueError("Either DATABASE_ID or PAGE_ID environment variable is required")
     
+    if is_database:
+        pages, discovered = discover_database_pages(database_id, client, notion_token)
+        page_ids_to_export, all_metadata = filter_ready_pages(pages)
+        if not discovered:
+            print("⚠️  Database query failed, existing articles will not be removed")
+    
+    # Incremental mode only applies to database exports, where query_database() already returned last_edited_time
+    incremental = incremental and is_database
+    
     if not page_ids_to_export:
+        # Only an answered query with zero Ready pages means every article was unpublished
+        if is_database and discovered:
+            if incremental:
+                remove_unreadied_articles(manifest, [], OUTPUT_DIR)
+            else:
+                clear_existing_articles(OUTPUT_DIR)
+            save_export_manifest(manifest)
+            write_json_atomic(METADATA_FILE, [], indent=2)
+            print(f"✅ Cleared metadata file (no published articles)")
         print("❌ No pages found to export")
         return
     
-    print(f"\n📋 Exporting {len(page_ids_to_export)} page(s)...")
+    # If we already have metadata (from database query), use it
+    # Otherwise, extract it during export
+    metadata_map = {meta.get("id"): meta for meta in all_metadata} if all_metadata else {}
+    
+    ready_ids = list(page_ids_to_export)
+    if incremental:
+        page_ids_to_export, unchanged_ids = plan_incremental_export(all_metadata, manifest, OUTPUT_DIR)
+        for page_id in unchanged_ids:
+            metadata_map[page_id]["filename"] = f"articles/{manifest[page_id]['filename']}"
+        print(f"♻️  {len(unchanged_ids)} unchanged page(s) skipped, {len(page_ids_to_export)} new or edited")
+    
+    # New output is staged and journaled; articles/ only changes once every page is done
+    journal = ExportJournal()
+    target = database_id if is_database else page_ids_str
+    resume = EXPORT_RESUME or "--resume" in sys.argv[1:]
+    resumed = resumable_pages(journal.load(target), page_ids_to_export, metadata_map) if resume else {}
+    if not resume and journal.journal_file.exists():
+        print("⚠️  Found an interrupted export; starting over (run with --resume to continue it)")
+    journal.begin(target, bool(resumed))
+    if resumed:
+        print(f"⏯️  Resuming: {len(resumed)} page(s) already exported by the interrupted run")
+    
+    print(f"\n📋 Exporting {len(page_ids_to_export) - len(resumed)} page(s)...")
+    export_metrics.mark("export_pages")
     
     # Export each page
     exported_files = []
+    # Old filenames of pages whose title changed, removed when the new output is swapped in
+    renamed_files = []
     
-    # If we already have metadata (from database query), use it
-    # Otherwise, extract it during export
-    metadata_map = {meta.get("id"): meta for meta in all_metadata} if all_metadata else {}
+    extract_metadata = is_database and not metadata_map
+    # Synced blocks and link targets are fetched once per run
+    shared_content = SharedContent()
     
-    for page_id in page_ids_to_export:
+    def export_results():
+        """Yield (page_id, filename, metadata) as pages finish, sequentially or from the worker pool"""
+        for page_id, record in resumed.items():
+            yield page_id, (record["filename"], record.get("metadata"))
+        page_ids = scheduler.order([page_id for page_id in page_ids_to_export if page_id not in resumed], metadata_map, OUTPUT_DIR)
+        if EXPORT_ENGINE == "async":
+            import export_notion_async
+            print(f"⚡ Exporting on the async engine (Notion rate limit: {NOTION_RATE_LIMIT:g} req/s)")
+            yield from export_notion_async.export_pages(page_ids, STAGING_DIR, notion_token, extract_metadata=extract_metadata,
+                                                        scheduler=scheduler, shared_content=shared_content)
+            return
+        
+        def export_scheduled(page_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+            started = time.monotonic()
+            result = export_page_to_markdown(page_id, client, STAGING_DIR, notion_token, extract_metadata=extract_metadata,
+                                             shared_content=shared_content)
+            scheduler.record(page_id, time.monotonic() - started)
+            return result
+        
+        if EXPORT_WORKERS == 1:
+            for page_id in page_ids:
+                if scheduler.should_start(page_id):
+                    yield page_id, export_scheduled(page_id)
+            return
+        print(f"🧵 Exporting with {EXPORT_WORKERS} workers (Notion rate limit: {NOTION_RATE_LIMIT:g} req/s)")
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            # Submit in priority order, one page per free worker, so the budget is checked before each page starts
+            queue = iter(page_ids)
+            futures = {}
+            
+            def submit_next():
+                for page_id in queue:
+                    if scheduler.should_start(page_id):
+                        futures[executor.submit(export_scheduled, page_id)] = page_id
+                        return
+            
+            for _ in range(EXPORT_WORKERS):
+                submit_next()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_id = futures.pop(future)
+                    submit_next()
+                    yield page_id, future.result()
+    
+    exported_ids = set()
+    for page_id, (filename, export_metadata) in export_results():
         try:
-            filename, export_metadata = export_page_to_markdown(
-                page_id, 
-                client, 
-                OUTPUT_DIR, 
-                notion_token, 
-                extract_metadata=is_database and not metadata_map
-            )
             if filename:
                 exported_files.append(filename)
                 # Use pre-extracted metadata if available, otherwise use export metadata
@@ -803,27 +1738,105 @@ def main():
                     elif not export_metadata["filename"].startswith("articles/"):
                         export_metadata["filename"] = filename_with_path
                     metadata_map[page_id] = export_metadata
+                if page_id not in resumed:
+                    journal.record_page(page_id, filename, metadata_map.get(page_id))
+                if is_database:
+                    previous = manifest.get(page_id, {}).get("filename")
+                    if previous and previous != filename:
+                        # Title (and therefore filename) changed since the last export
+                        renamed_files.append(previous)
+                    # content_hash is filled in once image references are final
+                    manifest[page_id] = {
+                        "last_edited_time": metadata_map.get(page_id, {}).get("last_edited_time"),
+                        "filename": filename,
+                        "export_seconds": scheduler.durations.get(page_id) or previous_manifest.get(page_id, {}).get("export_seconds"),
+                    }
+                exported_ids.add(page_id)
         except Exception as e:
             print(f"❌ Failed to export page {page_id}: {e}")
             continue
     
+    # Pages deferred by the time budget or failing to export keep their previous article;
+    # new ones stay unpublished until the next run
+    kept_files = set()
+    unfinished = [page_id for page_id in page_ids_to_export if page_id not in exported_ids]
+    for page_id in unfinished:
+        entry = previous_manifest.get(page_id)
+        if entry and (OUTPUT_DIR / entry.get("filename", "")).is_file():
+            manifest[page_id] = entry
+            kept_files.add(entry["filename"])
+            if page_id in metadata_map:
+                metadata_map[page_id]["filename"] = f"articles/{entry['filename']}"
+        else:
+            metadata_map.pop(page_id, None)
+    if scheduler.deferred:
+        print(f"⏰ {len(scheduler.deferred)} page(s) deferred to the next run")
+    failed_ids = [page_id for page_id in unfinished if page_id not in scheduler.deferred]
+    if failed_ids:
+        print(f"⚠️  {len(failed_ids)} page(s) failed to export, keeping their previous article where one exists")
+    
+    # Let the image download stage drain, then fix up image references in this run's files
+    exported_paths = [STAGING_DIR / filename for filename in exported_files if (STAGING_DIR / filename).exists()]
+    export_metrics.mark("image_downloads")
+    fell_back = finish_image_downloads(exported_paths)
+    if IMAGE_VARIANTS and exported_paths:
+        export_metrics.mark("image_variants")
+        import image_variants
+        image_variants.process_markdown_files(exported_paths)
+    
+    # Swap the staged output in; a crash from here on is finished by --resume
+    export_metrics.mark("save")
+    for staged in exported_paths:
+        os.replace(staged, OUTPUT_DIR / staged.name)
+    for previous in renamed_files:
+        if previous not in exported_files and (OUTPUT_DIR / previous).exists():
+            (OUTPUT_DIR / previous).unlink()
+    if incremental and discovered:
+        remove_unreadied_articles(manifest, ready_ids, OUTPUT_DIR)
+    elif is_database and discovered:
+        # Full exports replace every article, removing unpublished ones
+        clear_existing_articles(OUTPUT_DIR, keep=set(exported_files) | kept_files)
+    if is_database:
+        for page_id, entry in manifest.items():
+            if "content_hash" not in entry:
+                entry["content_hash"] = file_content_hash(OUTPUT_DIR / entry["filename"])
+            # The signed Notion URL of a failed image expires within the hour; download it again next run
+            if entry.get("filename") in fell_back:
+                entry["retry"] = True
+    
     # Convert metadata map back to list
     all_metadata = list(metadata_map.values())
     
     # Save metadata to JSON file (only published articles)
     # Clear existing metadata file and write only published articles
     try:
-        with open(METADATA_FILE, "w", encoding="utf-8") as f:
-            if all_metadata:
-                json.dump(all_metadata, f, indent=2, ensure_ascii=False)
-                print(f"✅ Saved metadata for {len(all_metadata)} published article(s) to: {METADATA_FILE}")
-            else:
-                # Write empty array if no published articles
-                json.dump([], f, indent=2)
-                print(f"✅ Cleared metadata file (no published articles)")
+        if all_metadata:
+            write_json_atomic(METADATA_FILE, all_metadata, indent=2, ensure_ascii=False)
+            print(f"✅ Saved metadata for {len(all_metadata)} published article(s) to: {METADATA_FILE}")
+        else:
+            # Write empty array if no published articles
+            write_json_atomic(METADATA_FILE, [], indent=2)
+            print(f"✅ Cleared metadata file (no published articles)")
     except Exception as e:
         print(f"⚠️  Warning: Could not save metadata: {e}")
     
+    image_index.save()
+    
+    # Full database exports rebuild the manifest too, so a later incremental run has a baseline
+    if is_database:
+        save_export_manifest(manifest)
+    journal.finish()
+    
+    # Only collect images when every page made it, otherwise a half-finished export would look unreferenced
+    if IMAGE_GC != "off":
+        failed_count = len(page_ids_to_export) - len(exported_files)
+        if failed_count:
+            print(f"⚠️  Skipping image GC: {failed_count} page(s) failed to export or were deferred")
+        else:
+            export_metrics.mark("image_gc")
+            import gc_images
+            gc_images.collect_garbage(IMAGE_GC)
+    
     print(f"\n✅ Export complete! {len(exported_files)} file(s) saved to: {OUTPUT_DIR}")
     if exported_files:
         print(f"📝 Exported files:")
@@ -832,5 +1845,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Let helper modules (export_notion_async) import this script without loading a second copy
+    sys.modules.setdefault("export_notion", sys.modules[__name__])
+    import export_report
+    export_report.run(main)
 
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Async Notion Export Engine - asyncio counterpart of the sync path in export_notion.py
+Page discovery, block tree fetching and image downloads run as awaitable tasks on one event loop;
+pages are then rendered with the same Markdown converter as the sync path
+Selected with EXPORT_ENGINE=async
+"""
+
+import os
+import time
+import queue
+import asyncio
+import threading
+import httpx
+from pathlib import Path
+from notion_client import AsyncClient
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+from export_notion import (
+    IMAGES_DIR,
+    IMAGE_CHUNK_SIZE,
+    NOTION_API_URL,
+    NOTION_API_VERSION,
+    NOTION_BASE_URL,
+    SEARCH_NEWEST_FIRST,
+    SEARCH_PAGES_FILTER,
+    ParentIndex,
+    SharedContent,
+    build_database_query,
+    database_schemas,
+    database_summary,
+    link_target_key,
+    page_summary,
+    synced_source_id,
+    notion_api_headers,
+    image_index,
+    image_key,
+    notion_rate_limiter,
+    throttle_on_rate_limit,
+    get_page_title,
+    image_filename_for_url,
+    image_request_headers,
+    write_page_markdown,
+)
+from export_report import export_metrics
+
+# Maximum number of requests in flight at once (Notion calls are additionally rate limited)
+ASYNC_MAX_IN_FLIGHT = max(1, int(os.getenv("ASYNC_MAX_IN_FLIGHT", "64")))
+# Pages exported at once; higher-priority pages start first as workers free up
+ASYNC_PAGE_WORKERS = max(1, int(os.getenv("ASYNC_PAGE_WORKERS", "16")))
+
+
+async def _acquire_rate_limit(request: httpx.Request):
+    await notion_rate_limiter.acquire_async()
+    export_metrics.count_request(request.method, request.url)
+
+
+async def _check_rate_limit(response: httpx.Response):
+    throttle_on_rate_limit(response.status_code, response.headers)
+
+
+class AsyncNotionSession:
+    """Notion and image HTTP clients sharing one in-flight limit"""
+
+    def __init__(self, notion_token: str, shared_content: Optional[SharedContent] = None):
+        self.notion_token = notion_token
+        self.shared_content = shared_content if shared_content is not None else SharedContent()
+        self.client = AsyncClient(auth=notion_token, client=httpx.AsyncClient(event_hooks={
+            "request": [_acquire_rate_limit],
+            "response": [_check_rate_limit],
+        }), base_url=NOTION_BASE_URL, notion_version=NOTION_API_VERSION)
+        self.http = httpx.AsyncClient(timeout=30, follow_redirects=True)
+        self.in_flight = asyncio.Semaphore(ASYNC_MAX_IN_FLIGHT)
+
+    async def __aenter__(self) -> "AsyncNotionSession":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.client.aclose()
+        await self.http.aclose()
+
+    async def list_all_children(self, block_id: str) -> Tuple[List[Dict[str, Any]], int]:
+        """List every child of a block, following next_cursor. Returns (children, request count)."""
+        children = []
+        requests_made = 0
+        cursor = None
+
+        while True:
+            kwargs = {"block_id": block_id, "page_size": 100}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            async with self.in_flight:
+                response = await self.client.blocks.children.list(**kwargs)
+            requests_made += 1
+
+            children.extend(response.get("results", []))
+
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+
+        return children, requests_made
+
+    async def fetch_block_children(self, block: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """A block's children, resolving synced blocks through self.shared_content like export_notion.fetch_block_children()"""
+        if block.get("type") != "synced_block":
+            return await self.list_all_children(block["id"])
+        requests_made = []
+
+        async def fetch():
+            children, count = await self.fetch_block_tree(synced_source_id(block))
+            requests_made.append(count)
+            return children
+
+        return await self.shared_content.get_async(f"synced:{synced_source_id(block)}", fetch), sum(requests_made)
+
+    async def fetch_link_summary(self, key: str) -> Optional[Dict[str, Any]]:
+        """Title and URL of a linked page or database, like export_notion.fetch_link_summary()"""
+        kind, target_id = key.split(":", 1)
+        try:
+            async with self.in_flight:
+                if kind == "database":
+                    return database_summary(await self.client.databases.retrieve(database_id=target_id))
+                return page_summary(await self.client.pages.retrieve(page_id=target_id))
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not retrieve linked {kind} {target_id}: {e}")
+            return None
+
+    async def link_summary(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        return await self.shared_content.get_async(key, lambda: self.fetch_link_summary(key)) if key else None
+
+    async def fetch_block_tree(self, page_id: str) -> Tuple[List[Dict[str, Any]], int]:
+        """Load a page's whole block tree level by level, same shape as export_notion.fetch_block_tree()"""
+        top_level, total_requests = await self.list_all_children(page_id)
+        level = top_level
+        links = []
+
+        while level:
+            links.extend(block for block in level if block.get("type") == "link_to_page")
+            parents = [block for block in level if block.get("has_children") and block.get("id")]
+            results = await asyncio.gather(*(self.fetch_block_children(block) for block in parents))
+            next_level = []
+            for block, (children, requests_made) in zip(parents, results):
+                block["children"] = children
+                total_requests += requests_made
+                if block.get("type") != "synced_block":
+                    next_level.extend(children)
+            level = next_level
+
+        summaries = await asyncio.gather(*(self.link_summary(link_target_key(block)) for block in links))
+        for block, summary in zip(links, summaries):
+            block["linked_page"] = summary
+
+        return top_level, total_requests
+
+    async def refresh_parent_index(self) -> ParentIndex:
+        """Bring the persisted parent index up to date, like export_notion.refresh_parent_index()"""
+        index = ParentIndex()
+        full_scan = index.begin_refresh()
+        cursor = None
+
+        while True:
+            kwargs = {"filter": SEARCH_PAGES_FILTER, "sort": SEARCH_NEWEST_FIRST, "page_size": 100}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            async with self.in_flight:
+                response = await self.client.search(**kwargs)
+
+            if not index.add_search_results(response.get("results", [])):
+                break
+            if not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+
+        index.finish_refresh(full_scan)
+        return index
+
+    async def query_database(self, database_id: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """Query a Notion database and return (all pages, whether the query succeeded), falling back to search like the sync path"""
+        pages = []
+        cursor = None
+
+        print(f"🔍 Querying database: {database_id}")
+
+        try:
+            headers = notion_api_headers(self.notion_token)
+
+            # Same server-side Ready filter, sort and property projection as the sync path
+            async with self.in_flight:
+                await notion_rate_limiter.acquire_async()
+                response = await self.http.get(f"{NOTION_API_URL}/databases/{database_id}", headers=headers)
+            export_metrics.count_request("GET", response.url)
+            throttle_on_rate_limit(response.status_code, response.headers)
+            schema = response.json().get("properties", {}) if response.status_code == 200 else {}
+            if schema:
+                database_schemas[database_id] = schema
+            base_payload, params = build_database_query(schema)
+
+            while True:
+                payload = dict(base_payload)
+                if cursor:
+                    payload["start_cursor"] = cursor
+
+                async with self.in_flight:
+                    await notion_rate_limiter.acquire_async()
+                    response = await self.http.post(f"{NOTION_API_URL}/databases/{database_id}/query", headers=headers, params=params, json=payload)
+                export_metrics.count_request("POST", response.url)
+                throttle_on_rate_limit(response.status_code, response.headers)
+                response.raise_for_status()
+
+                data = response.json()
+                pages.extend(data.get("results", []))
+
+                if not data.get("has_more"):
+                    break
+                cursor = data.get("next_cursor")
+
+            # With the Ready filter, an empty result is a real answer
+            if pages or "filter" in base_payload:
+                print(f"✓ Found {len(pages)} page(s) in database")
+                return pages, True
+        except Exception as e:
+            print(f"  ⚠️  Error with direct API call: {e}")
+            pages = []
+
+        print(f"💡 Using page index as fallback to find pages in database...")
+        try:
+            for page in (await self.refresh_parent_index()).children("database_id", database_id):
+                pages.append(page)
+                print(f"  ✓ Found page in database: {get_page_title(page)}")
+        except Exception as e:
+            print(f"⚠️  Error using page index: {e}")
+
+        print(f"✓ Found {len(pages)} page(s) in database")
+        return pages, False
+
+    async def find_child_pages(self, parent_page_id: str) -> List[str]:
+        """Find all child pages of a parent page"""
+        child_page_ids = []
+
+        try:
+            print("🔍 Searching for child_page blocks...")
+            blocks, _ = await self.list_all_children(parent_page_id)
+            for block in blocks:
+                if block.get("type") == "child_page" and block.get("id"):
+                    child_page_ids.append(block["id"])
+                    # child_page blocks carry their title, no extra request needed
+                    print(f"  ✓ Found child page: {block.get('child_page', {}).get('title') or block['id']}")
+
+            if not child_page_ids:
+                print("🔍 Looking up children in the page index...")
+                for page in (await self.refresh_parent_index()).children("page_id", parent_page_id):
+                    if page.get("id") and page["id"] not in child_page_ids:
+                        child_page_ids.append(page["id"])
+                        print(f"  ✓ Found child page: {get_page_title(page)}")
+        except Exception as e:
+            print(f"⚠️  Warning: Error finding child pages: {e}")
+
+        return child_page_ids
+
+    async def download_image(self, image_url: str, block_id: Optional[str] = None):
+        """Download an image and record it in the shared image index, like export_notion.download_image()"""
+        key = image_key(image_url, block_id)
+        if image_index.lookup(key):
+            return
+        filename = image_filename_for_url(image_url, block_id)
+        local_path = IMAGES_DIR / filename
+        if local_path.exists():
+            image_index.add(key, local_path)
+            return
+
+        # Same .part + Range resume + atomic rename scheme as export_notion.ImageDownloader
+        part_path = IMAGES_DIR / f"{filename}.part"
+        try:
+            headers = image_request_headers(image_url, self.notion_token)
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+            async with self.in_flight:
+                async with self.http.stream("GET", image_url, headers=headers) as response:
+                    if response.status_code == 416:
+                        part_path.unlink()
+                    response.raise_for_status()
+                    content_type = response.headers.get("content-type", "")
+                    if not content_type.startswith("image/"):
+                        print(f"  ⚠️  Warning: URL did not return an image (content-type: {content_type})")
+                        return
+                    resumed = offset and response.status_code == 206
+                    with open(part_path, "ab" if resumed else "wb") as f:
+                        async for chunk in response.aiter_bytes(IMAGE_CHUNK_SIZE):
+                            f.write(chunk)
+                            export_metrics.count("image_bytes", len(chunk))
+            os.replace(part_path, local_path)
+            export_metrics.count("images_downloaded")
+            if resumed:
+                export_metrics.count("image_downloads_resumed")
+            filename = image_index.add(key, local_path)
+            print(f"  📷 Downloaded image: {filename}")
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not download image {image_url}: {e}")
+            export_metrics.count("image_downloads_failed")
+
+    async def prefetch_images(self, blocks: List[Dict[str, Any]]):
+        """Download every image in a block tree concurrently so rendering finds them on disk"""
+        images = {}
+        stack = list(blocks)
+        while stack:
+            block = stack.pop()
+            if block.get("type") == "image":
+                image = block.get("image", {})
+                url = (image.get("file") or image.get("external") or {}).get("url")
+                if url:
+                    images[image_key(url, block.get("id"))] = (url, block.get("id"))
+            stack.extend(block.get("children", []))
+        await asyncio.gather(*(self.download_image(url, block_id) for url, block_id in images.values()))
+
+    async def export_page(self, page_id: str, output_path: Path, extract_metadata: bool) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Fetch a page, its block tree and images, then render it. Returns (filename, metadata)."""
+        try:
+            with export_metrics.timed("retrieve", page_id):
+                async with self.in_flight:
+                    page = await self.client.pages.retrieve(page_id=page_id)
+            self.shared_content.put(f"page:{page.get('id')}", page_summary(page))
+            print(f"📄 Exporting: {get_page_title(page)}")
+
+            with export_metrics.timed("fetch_blocks", page_id):
+                all_blocks, request_count = await self.fetch_block_tree(page_id)
+            print(f"  🌳 Fetched block tree in {request_count} request(s)")
+
+            if self.notion_token:
+                with export_metrics.timed("images", page_id):
+                    await self.prefetch_images(all_blocks)
+
+            # The tree is fully loaded, so the renderer never needs a client
+            with export_metrics.timed("render", page_id):
+                return await asyncio.to_thread(write_page_markdown, page, all_blocks, None, output_path, self.notion_token, extract_metadata)
+        except Exception as e:
+            print(f"❌ Error exporting page {page_id}: {e}")
+            return None, None
+
+
+def query_database(database_id: str, notion_token: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """Run AsyncNotionSession.query_database() on a fresh event loop"""
+    async def run():
+        async with AsyncNotionSession(notion_token) as session:
+            return await session.query_database(database_id)
+    return asyncio.run(run())
+
+
+def find_child_pages(parent_page_id: str, notion_token: str) -> List[str]:
+    """Run AsyncNotionSession.find_child_pages() on a fresh event loop"""
+    async def run():
+        async with AsyncNotionSession(notion_token) as session:
+            return await session.find_child_pages(parent_page_id)
+    return asyncio.run(run())
+
+
+def export_pages(page_ids: List[str], output_path: Path, notion_token: str, extract_metadata: bool = False,
+                 scheduler: Optional[Any] = None, shared_content: Optional[SharedContent] = None) -> Iterator[Tuple[str, Tuple[Optional[str], Optional[Dict[str, Any]]]]]:
+    """Export pages concurrently on one event loop, starting them in list order. Yields (page_id, (filename, metadata)).
+
+    Results are yielded as each page finishes, so the caller can journal it before the
+    rest are done. With a scheduler (see export_notion.ExportScheduler), each page is
+    started only if it fits the time budget.
+    """
+    finished: queue.Queue = queue.Queue()
+    done = object()
+
+    async def run():
+        pending = iter(page_ids)
+        async with AsyncNotionSession(notion_token, shared_content) as session:
+            async def worker():
+                for page_id in pending:
+                    if scheduler and not scheduler.should_start(page_id):
+                        continue
+                    started = time.monotonic()
+                    result = await session.export_page(page_id, output_path, extract_metadata)
+                    if scheduler:
+                        scheduler.record(page_id, time.monotonic() - started)
+                    finished.put((page_id, result))
+            await asyncio.gather(*(worker() for _ in range(min(ASYNC_PAGE_WORKERS, len(page_ids)) or 1)))
+
+    def run_loop():
+        try:
+            asyncio.run(run())
+        except BaseException as e:
+            finished.put(e)
+        finally:
+            finished.put(done)
+
+    # The event loop runs in its own thread; a daemon, so an interrupted export does not wait for it
+    threading.Thread(target=run_loop, name="async-export", daemon=True).start()
+    while True:
+        item = finished.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
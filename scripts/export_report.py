@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Export Report - Opt-in instrumentation for export_notion.py
+Records wall time per stage and per page, Notion API calls by endpoint, rate-limit
+hits, image downloads and peak memory, and writes them as JSON (EXPORT_REPORT=<path>)
+EXPORT_PROFILE=<path> additionally runs the export under cProfile and dumps the stats there
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+from typing import Callable, Dict, Any, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Configuration
+EXPORT_REPORT = os.getenv("EXPORT_REPORT", "").strip()
+EXPORT_PROFILE = os.getenv("EXPORT_PROFILE", "").strip()
+# Functions listed in the console summary of a profiled run
+PROFILE_TOP_FUNCTIONS = 25
+
+# Notion ids in URL paths, dashed or not
+NOTION_ID_RE = re.compile(r'[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}', re.IGNORECASE)
+
+
+def endpoint_name(method: str, url: Any) -> str:
+    """Group requests by endpoint, e.g. "GET /v1/blocks/{id}/children" """
+    path = urlparse(str(url)).path
+    return f"{method.upper()} {NOTION_ID_RE.sub('{id}', path)}"
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Peak resident set size of this process"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class ExportMetrics:
+    """Thread-safe counters and timers shared by the sync and async export paths"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.perf_counter()
+            self.stages: Dict[str, float] = {}
+            self.pages: Dict[str, Dict[str, float]] = {}
+            self.api_calls: Dict[str, int] = {}
+            self.counters: Dict[str, int] = {}
+            self.config: Dict[str, Any] = {}
+            self.current_stage: Optional[str] = None
+            self.stage_started = self.started
+
+    def mark(self, stage: Optional[str]):
+        """Close the running top-level stage and start the next one (None just closes it)"""
+        now = time.perf_counter()
+        with self._lock:
+            if self.current_stage:
+                self.stages[self.current_stage] = self.stages.get(self.current_stage, 0.0) + now - self.stage_started
+            self.current_stage = stage
+            self.stage_started = now
+
+    @contextmanager
+    def timed(self, step: str, page_id: Optional[str] = None) -> Iterator[None]:
+        """Time a step of one page's export (wall time, so concurrent pages overlap)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                timings = self.pages.setdefault(page_id or "-", {})
+                timings[step] = timings.get(step, 0.0) + elapsed
+
+    def count_request(self, method: str, url: Any):
+        name = endpoint_name(method, url)
+        with self._lock:
+            self.api_calls[name] = self.api_calls.get(name, 0) + 1
+
+    def count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def report(self) -> Dict[str, Any]:
+        """Everything recorded so far as a JSON-serialisable dict"""
+        self.mark(None)
+        with self._lock:
+            page_totals = {page_id: sum(steps.values()) for page_id, steps in self.pages.items()}
+            slowest = sorted(page_totals, key=page_totals.get, reverse=True)
+            return {
+                "generated_at": datetime.now().isoformat(timespec="seconds"),
+                "config": dict(self.config),
+                "total_seconds": round(time.perf_counter() - self.started, 3),
+                "peak_memory_mb": round(peak_memory_mb() or 0, 1) or None,
+                "stages": {stage: round(seconds, 3) for stage, seconds in self.stages.items()},
+                "api_calls": dict(sorted(self.api_calls.items())),
+                "api_calls_total": sum(self.api_calls.values()),
+                "counters": dict(sorted(self.counters.items())),
+                "pages": {page_id: {step: round(seconds, 3) for step, seconds in self.pages[page_id].items()} for page_id in slowest},
+            }
+
+
+export_metrics = ExportMetrics()
+
+
+def write_report(report_path: Path):
+    """Write the JSON report and print how the run compares to the previous report at the same path"""
+    report = export_metrics.report()
+    previous_total = None
+    try:
+        with open(report_path, "r", encoding="utf-8") as f:
+            previous_total = json.load(f).get("total_seconds")
+    except (OSError, ValueError):
+        pass
+
+    try:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write export report: {e}")
+        return
+
+    summary = f"📈 Export report: {report['total_seconds']:.1f}s, {report['api_calls_total']} API call(s)"
+    if report["peak_memory_mb"]:
+        summary += f", peak {report['peak_memory_mb']:.0f} MB"
+    if previous_total:
+        summary += f" ({report['total_seconds'] - previous_total:+.1f}s vs previous run)"
+    print(f"{summary} -> {report_path}")
+
+
+def run(main: Callable[[], Any]):
+    """Run the export, under cProfile if EXPORT_PROFILE is set, and write the report if EXPORT_REPORT is set"""
+    export_metrics.reset()
+    try:
+        if EXPORT_PROFILE:
+            import cProfile
+            import pstats
+            profiler = cProfile.Profile()
+            try:
+                profiler.runcall(main)
+            finally:
+                profiler.dump_stats(EXPORT_PROFILE)
+                print(f"\n🔬 Profile written to: {EXPORT_PROFILE}")
+                pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_TOP_FUNCTIONS)
+        else:
+            main()
+    finally:
+        if EXPORT_REPORT:
+            write_report(Path(EXPORT_REPORT))
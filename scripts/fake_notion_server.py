@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Fake Notion Server - Local stand-in for the parts of the Notion API export_notion.py uses
+Serves a generated workspace (one database of article pages with nested blocks and
+images) over HTTP: pages retrieve, blocks children list, database retrieve/query,
+search and signed file downloads, with optional latency and 429 injection
+Run standalone and point the exporter at it with NOTION_BASE_URL, or use benchmark_export.py
+"""
+
+import os
+import json
+import time
+import uuid
+import zlib
+import random
+import struct
+import secrets
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+from typing import Dict, List, Any, Optional, Tuple
+
+# Configuration (standalone mode)
+FAKE_NOTION_PORT = int(os.getenv("FAKE_NOTION_PORT", "8700"))
+FAKE_NOTION_PAGES = int(os.getenv("FAKE_NOTION_PAGES", "50"))
+FAKE_NOTION_BLOCKS = int(os.getenv("FAKE_NOTION_BLOCKS", "40"))
+FAKE_NOTION_DEPTH = int(os.getenv("FAKE_NOTION_DEPTH", "2"))
+FAKE_NOTION_IMAGES = int(os.getenv("FAKE_NOTION_IMAGES", "2"))
+FAKE_NOTION_LATENCY_MS = float(os.getenv("FAKE_NOTION_LATENCY_MS", "0"))
+FAKE_NOTION_429_RATE = float(os.getenv("FAKE_NOTION_429_RATE", "0"))
+
+# Share of pages with Ready checked
+READY_SHARE = 0.9
+# Every image is a solid PNG of this size
+IMAGE_SIZE = (800, 600)
+CATEGORIES = ["Android", "Kotlin", "Architecture", "Testing", "Tooling"]
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+         "incididunt ut labore et dolore magna aliqua notion export markdown render").split()
+
+
+def rich_text(content: str, bold: bool = False) -> List[Dict[str, Any]]:
+    annotations = {"bold": bold, "italic": False, "strikethrough": False, "underline": False, "code": False, "color": "default"}
+    return [{"type": "text", "text": {"content": content, "link": None}, "annotations": annotations, "plain_text": content, "href": None}]
+
+
+def solid_png(width: int, height: int, color: Tuple[int, int, int]) -> bytes:
+    """Encode a single-colour RGB PNG without any imaging library"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    row = b"\x00" + bytes(color) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height, 9))
+            + chunk(b"IEND", b""))
+
+
+class SyntheticWorkspace:
+    """A deterministic database of article pages with nested block trees"""
+
+    def __init__(self, pages: int = 50, blocks: int = 40, depth: int = 2, images: int = 2, seed: int = 1):
+        self.rng = random.Random(seed)
+        self.database_id = self.new_id()
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, List[Dict[str, Any]]] = {}
+        self.files: Dict[str, Tuple[int, int, int]] = {}
+        self.schema = {
+            "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+            "Ready": {"id": "rdy%3A", "name": "Ready", "type": "checkbox", "checkbox": {}},
+            "Category": {"id": "cat%3B", "name": "Category", "type": "multi_select", "multi_select": {}},
+            "Published": {"id": "pub%3C", "name": "Published", "type": "date", "date": {}},
+            "Excerpt": {"id": "exc%3D", "name": "Excerpt", "type": "rich_text", "rich_text": {}},
+            "Notes": {"id": "nts%3E", "name": "Notes", "type": "rich_text", "rich_text": {}},
+        }
+        for index in range(pages):
+            self.add_page(index, blocks, depth, images)
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128)))
+
+    def timestamp(self, index: int) -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:00.000Z", time.gmtime(1700000000 + index * 3600))
+
+    def sentence(self, words: int = 12) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+    def add_page(self, index: int, blocks: int, depth: int, images: int):
+        page_id = self.new_id()
+        title = f"Synthetic article {index + 1}"
+        edited = self.timestamp(index)
+        self.pages[page_id] = {
+            "object": "page",
+            "id": page_id,
+            "created_time": self.timestamp(0),
+            "last_edited_time": edited,
+            "archived": False,
+            "parent": {"type": "database_id", "database_id": self.database_id},
+            "properties": {
+                "Name": {"id": "title", "type": "title", "title": rich_text(title)},
+                "Ready": {"id": "rdy%3A", "type": "checkbox", "checkbox": self.rng.random() < READY_SHARE},
+                "Category": {"id": "cat%3B", "type": "multi_select", "multi_select": [{"name": self.rng.choice(CATEGORIES)}]},
+                "Published": {"id": "pub%3C", "type": "date", "date": {"start": edited[:10]}},
+                "Excerpt": {"id": "exc%3D", "type": "rich_text", "rich_text": rich_text(self.sentence(20))},
+                "Notes": {"id": "nts%3E", "type": "rich_text", "rich_text": rich_text(self.sentence(40))},
+            },
+        }
+        image_slots = set(self.rng.sample(range(blocks), min(images, blocks)))
+        self.children[page_id] = [self.make_block(edited, depth, slot in image_slots) for slot in range(blocks)]
+
+    def make_block(self, edited: str, depth: int, image: bool = False) -> Dict[str, Any]:
+        block_id = self.new_id()
+        block = {"object": "block", "id": block_id, "created_time": edited, "last_edited_time": edited, "has_children": False}
+        if image:
+            color = (self.rng.randrange(256), self.rng.randrange(256), self.rng.randrange(256))
+            self.files[block_id] = color
+            block.update(type="image", image={"type": "file", "caption": rich_text("Figure"), "file": {"url": None}})
+            return block
+
+        kind = self.rng.choice(["paragraph", "paragraph", "paragraph", "heading_2", "bulleted_list_item", "code", "quote", "toggle"])
+        if kind == "toggle" and depth > 0:
+            block.update(type="toggle", has_children=True, toggle={"rich_text": rich_text(self.sentence(4), bold=True)})
+            self.children[block_id] = [self.make_block(edited, depth - 1) for _ in range(self.rng.randint(2, 5))]
+        elif kind == "code":
+            block.update(type="code", code={"rich_text": rich_text("fun main() {\n    println(\"hello\")\n}"), "language": "kotlin"})
+        elif kind == "heading_2":
+            block.update(type="heading_2", heading_2={"rich_text": rich_text(self.sentence(5))})
+        else:
+            kind = "paragraph" if kind == "toggle" else kind
+            block.update(type=kind, **{kind: {"rich_text": rich_text(self.sentence())}})
+        return block
+
+    def image_bytes(self, block_id: str) -> Optional[bytes]:
+        color = self.files.get(block_id)
+        return solid_png(*IMAGE_SIZE, color) if color else None
+
+
+def paginate(results: List[Dict[str, Any]], start_cursor: Optional[str], page_size: Any) -> Dict[str, Any]:
+    start = int(start_cursor or 0)
+    size = max(1, min(int(page_size or 100), 100))
+    chunk = results[start:start + size]
+    has_more = start + size < len(results)
+    return {"object": "list", "results": chunk, "has_more": has_more, "next_cursor": str(start + size) if has_more else None}
+
+
+class FakeNotionHandler(BaseHTTPRequestHandler):
+    server: "FakeNotionServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_error_json(self, status: int, code: str, message: str, headers: Optional[Dict[str, str]] = None):
+        self.send_json(status, {"object": "error", "status": status, "code": code, "message": message}, headers)
+
+    def read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def handle_request(self, method: str):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [part for part in url.path.split("/") if part]
+        body = self.read_json() if method == "POST" else {}
+        if not self.server.admit(parts):
+            self.send_error_json(429, "rate_limited", "Rate limited", {"Retry-After": str(self.server.retry_after)})
+            return
+
+        workspace = self.server.workspace
+        if parts[:1] == ["files"] and len(parts) == 2:
+            self.send_file(parts[1].split(".")[0])
+        elif parts[:2] == ["v1", "pages"] and len(parts) == 3 and method == "GET":
+            page = workspace.pages.get(parts[2])
+            if page:
+                self.send_json(200, page)
+            else:
+                self.send_error_json(404, "object_not_found", f"Could not find page with ID: {parts[2]}")
+        elif parts[:2] == ["v1", "blocks"] and len(parts) == 4 and parts[3] == "children" and method == "GET":
+            children = [self.server.with_file_url(block) for block in workspace.children.get(parts[2], [])]
+            self.send_json(200, paginate(children, query.get("start_cursor", [None])[0], query.get("page_size", [100])[0]))
+        elif parts[:2] == ["v1", "databases"] and len(parts) == 3 and method == "GET":
+            self.send_json(200, {"object": "database", "id": workspace.database_id, "properties": workspace.schema})
+        elif parts[:2] == ["v1", "databases"] and len(parts) == 4 and parts[3] == "query" and method == "POST":
+            self.send_json(200, paginate(self.server.query(body, query.get("filter_properties")), body.get("start_cursor"), body.get("page_size")))
+        elif parts == ["v1", "search"] and method == "POST":
+            pages = sorted(workspace.pages.values(), key=lambda page: page["last_edited_time"], reverse=True)
+            self.send_json(200, paginate(pages, body.get("start_cursor"), body.get("page_size")))
+        else:
+            self.send_error_json(400, "invalid_request_url", f"Invalid request URL: {method} {url.path}")
+
+    def send_file(self, block_id: str):
+        data = self.server.workspace.image_bytes(block_id)
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        status = 200
+        start = 0
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            start = int(range_header[len("bytes="):].split("-")[0] or 0)
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+        self.send_response(status)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data) - start))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        self.wfile.write(data[start:])
+        self.server.count("file_bytes", len(data) - start)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+
+class FakeNotionServer(ThreadingHTTPServer):
+    """Threaded HTTP server over a SyntheticWorkspace, counting requests by endpoint"""
+
+    daemon_threads = True
+
+    def __init__(self, workspace: SyntheticWorkspace, port: int = 0, latency_ms: float = 0, rate_429: float = 0, retry_after: float = 1):
+        super().__init__(("127.0.0.1", port), FakeNotionHandler)
+        self.workspace = workspace
+        self.latency_ms = latency_ms
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.stats: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._rng = random.Random(0)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + amount
+
+    def admit(self, parts: List[str]) -> bool:
+        """Apply the simulated latency; False when this API request should get a 429"""
+        self.count("requests")
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        if parts[:1] != ["v1"]:
+            return True
+        with self._lock:
+            limited = self._rng.random() < self.rate_429
+        self.count("rate_limited" if limited else "api_requests")
+        return not limited
+
+    def with_file_url(self, block: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in a freshly signed, expiring URL, as Notion does on every read"""
+        if block.get("type") != "image":
+            return block
+        block = json.loads(json.dumps(block))
+        signature = secrets.token_hex(16)
+        block["image"]["file"] = {
+            "url": f"{self.base_url}/files/{block['id']}.png?X-Amz-Expires=3600&X-Amz-Signature={signature}",
+            "expiry_time": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(time.time() + 3600)),
+        }
+        return block
+
+    def query(self, body: Dict[str, Any], filter_properties: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Database pages after the checkbox filter, sort and property projection the exporter sends"""
+        pages = list(self.workspace.pages.values())
+        condition = body.get("filter") or {}
+        if "checkbox" in condition:
+            name = next((name for name, prop in self.workspace.schema.items() if condition["property"] in (name, prop["id"])), None)
+            expected = condition["checkbox"].get("equals")
+            pages = [page for page in pages if name and page["properties"][name]["checkbox"] == expected]
+        for sort in reversed(body.get("sorts") or []):
+            if sort.get("timestamp"):
+                pages.sort(key=lambda page: page[sort["timestamp"]], reverse=sort.get("direction") == "descending")
+        if filter_properties:
+            wanted = set(filter_properties)
+            pages = [dict(page, properties={name: prop for name, prop in page["properties"].items() if unquote(prop["id"]) in wanted})
+                     for page in pages]
+        return pages
+
+    def start(self) -> "FakeNotionServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    """Serve a synthetic workspace until interrupted"""
+    workspace = SyntheticWorkspace(FAKE_NOTION_PAGES, FAKE_NOTION_BLOCKS, FAKE_NOTION_DEPTH, FAKE_NOTION_IMAGES)
+    server = FakeNotionServer(workspace, FAKE_NOTION_PORT, FAKE_NOTION_LATENCY_MS, FAKE_NOTION_429_RATE)
+    print(f"🧪 Fake Notion workspace: {len(workspace.pages)} page(s), database {workspace.database_id}")
+    print(f"🌐 Serving on {server.base_url} (export with NOTION_BASE_URL={server.base_url} DATABASE_ID={workspace.database_id})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Image GC - Removes files in images/ that no page references anymore
+Scans articles/*.md, sections/*.md and the site's HTML/JS/CSS for image references,
+keeps a per-file reference index so unchanged files are not re-read, and deletes
+(IMAGE_GC=delete) or only reports (IMAGE_GC=report) unreferenced images
+"""
+
+import os
+import re
+import json
+from pathlib import Path
+from typing import Dict, List, Any, Set
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+IMAGES_DIR = ROOT_DIR / "images"
+CACHE_DIR = ROOT_DIR / ".cache"
+REFS_INDEX_FILE = CACHE_DIR / "image_refs.json"
+# Export data that refers to images by filename and is pruned along with them
+IMAGE_DATA_FILES = {
+    "image_index": ROOT_DIR / "data" / "image_index.json",
+    "image_variants": ROOT_DIR / "data" / "image_variants.json",
+    "image_meta": ROOT_DIR / "data" / "image_meta.json",
+}
+REFERENCE_GLOBS = ["articles/*.md", "sections/*.md", "*.html", "*.js", "*.css"]
+
+# Any path under images/, including srcset entries and absolute URLs to this repo
+IMAGE_REF_RE = re.compile(r'images/([\w\-./]+\.\w+)')
+
+
+def load_refs_index() -> Dict[str, Dict[str, Any]]:
+    """Load the source file -> {mtime_ns, size, refs} index from the previous run"""
+    try:
+        with open(REFS_INDEX_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_refs_index(index: Dict[str, Dict[str, Any]]):
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(REFS_INDEX_FILE, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not save image reference index: {e}")
+
+
+def count_references() -> Dict[str, int]:
+    """Reference count per image path (relative to images/), re-reading only files that changed"""
+    previous = load_refs_index()
+    index = {}
+    rescanned = 0
+
+    for pattern in REFERENCE_GLOBS:
+        for source in ROOT_DIR.glob(pattern):
+            key = source.relative_to(ROOT_DIR).as_posix()
+            stat = source.stat()
+            entry = previous.get(key)
+            if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                text = source.read_text(encoding="utf-8", errors="ignore")
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "refs": IMAGE_REF_RE.findall(text)}
+                rescanned += 1
+            index[key] = entry
+
+    save_refs_index(index)
+    print(f"🔎 Scanned image references in {len(index)} file(s) ({rescanned} re-read)")
+
+    counts: Dict[str, int] = {}
+    for entry in index.values():
+        for ref in entry["refs"]:
+            counts[ref] = counts.get(ref, 0) + 1
+    return counts
+
+
+def find_unreferenced_images(counts: Dict[str, int]) -> List[Path]:
+    """Files under images/ with a reference count of zero (in-progress .part downloads are left alone)"""
+    unreferenced = []
+    for path in IMAGES_DIR.rglob("*"):
+        if not path.is_file() or path.name.startswith(".") or path.suffix == ".part":
+            continue
+        if counts.get(path.relative_to(IMAGES_DIR).as_posix(), 0) == 0:
+            unreferenced.append(path)
+    return sorted(unreferenced)
+
+
+def prune_image_data(removed: Set[str]):
+    """Drop entries for removed images from the export's image index files"""
+    for name, data_file in IMAGE_DATA_FILES.items():
+        if not data_file.exists():
+            continue
+        try:
+            with open(data_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if name == "image_index":
+                for section in ("keys", "hashes"):
+                    data[section] = {k: v for k, v in data.get(section, {}).items() if v not in removed}
+            elif name == "image_variants":
+                data = {k: v for k, v in data.items()
+                        if not any(src[len("images/"):] in removed for sources in v["variants"].values() for _, src in sources)}
+            else:
+                data = {k: v for k, v in data.items() if k not in removed}
+            with open(data_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not prune {data_file.name}: {e}")
+
+
+def collect_garbage(mode: str = "report") -> List[Path]:
+    """Find unreferenced images and delete them when mode is "delete". Returns the unreferenced files."""
+    if mode not in ("report", "delete"):
+        return []
+
+    unreferenced = find_unreferenced_images(count_references())
+    if not unreferenced:
+        print("✓ No unreferenced images")
+        return unreferenced
+
+    total_bytes = sum(path.stat().st_size for path in unreferenced)
+    action = "Removing" if mode == "delete" else "Found"
+    print(f"🗑️  {action} {len(unreferenced)} unreferenced image(s) ({total_bytes / 1024 / 1024:.1f} MB)")
+
+    removed = set()
+    for path in unreferenced:
+        name = path.relative_to(IMAGES_DIR).as_posix()
+        if mode == "delete":
+            try:
+                path.unlink()
+                removed.add(name)
+            except OSError as e:
+                print(f"  ⚠️  Warning: Could not remove {name}: {e}")
+                continue
+        print(f"  - {name}")
+
+    if removed:
+        prune_image_data(removed)
+    return unreferenced
+
+
+def main():
+    """Main function"""
+    print("🧹 Image garbage collection...")
+    collect_garbage(os.getenv("IMAGE_GC", "report").strip().lower())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,31 @@
 #!/usr/bin/env python3
 """
-Generate Article Metadata - Automatically generates article metadata for JavaScript files
-Scans the articles directory and updates article.js and script.js with article information
+Generate Article Metadata - Automatically generates the article list the site loads
+Indexes the articles directory in a SQLite article index (see article_index.py) and writes
+data/articles.json from it, which script.js and article.js fetch
 Now supports Notion metadata from JSON file
 """
 
+import os
 import re
+import math
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List
+
+from article_index import ArticleIndex
+from prerender_articles import table_of_contents
 
 # Configuration
 ARTICLES_DIR = Path(__file__).parent.parent / "articles"
 METADATA_FILE = Path(__file__).parent.parent / "data" / "articles_metadata.json"
-ARTICLE_JS = Path(__file__).parent.parent / "article.js"
-SCRIPT_JS = Path(__file__).parent.parent / "script.js"
+# Generated article list; only rewritten when its content hash changes
+ARTICLES_DATA_FILE = Path(__file__).parent.parent / "data" / "articles.json"
+# Per-article sidecars (table of contents, reading time) read by article.js
+SIDECAR_DIR = Path(__file__).parent.parent / "data" / "articles"
+# Reading speed used for "min read", same as article.js used to compute in the browser
+WORDS_PER_MINUTE = 200
 
 # Icon mapping based on keywords in title/filename
 ICON_MAPPING = {
@@ -43,111 +54,88 @@ ICON_MAPPING = {
 }
 
 
-def extract_title_and_description(markdown_content: str) -> tuple[str, str]:
-    """Extract title and description from markdown content"""
-    lines = markdown_content.split('\n')
+# Fallback extraction looks at most at this many characters from the top of an article
+EXTRACT_MAX_CHARS = 64 * 1024
+
+# Patterns used by extract_title_and_description()
+HEADING_RE = re.compile(r'^#+\s+(.+)$')
+BULLET_MARKER_RE = re.compile(r'^[-*+]\s+')
+NUMBER_MARKER_RE = re.compile(r'^\d+\.\s+')
+SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+MARKDOWN_CLEANUP = [
+    (re.compile(r'\*\*(.+?)\*\*'), r'\1'),  # Remove bold
+    (re.compile(r'\*(.+?)\*'), r'\1'),  # Remove italic
+    (re.compile(r'`(.+?)`'), r'\1'),  # Remove code
+    (re.compile(r'\[(.+?)\]\(.+?\)'), r'\1'),  # Remove links, keep text
+    (re.compile(r'\.\.+'), '...'),  # Fix double periods
+]
+
+
+def extract_title_and_description_from_lines(lines: Iterable[str]) -> tuple[str, str]:
+    """Extract title and description in one pass over markdown lines, stopping at the first good paragraph.
+
+    The title is the first heading (or, without any heading, the first line of text);
+    the description is built from the paragraph lines that follow the title.
+    """
     title = ""
-    description = ""
-    
-    # Find the first H1 heading
-    for line in lines:
-        line = line.strip()
-        if line.startswith('# '):
-            title = line[2:].strip()
-            break
-        elif line.startswith('#'):
-            # Handle cases where there might be multiple #
-            match = re.match(r'^#+\s+(.+)$', line)
-            if match:
-                title = match.group(1).strip()
-                break
-    
-    # If no H1 found, use filename or first line
-    if not title:
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                title = line[:100]  # Use first non-empty line as title
-                break
-    
-    # Extract description (first meaningful paragraph, can be after headings)
+    first_line = ""
     description_lines = []
-    found_title = False
-    skip_next_empty = False
     found_paragraph = False
     
     for line in lines:
         line = line.strip()
+        if not line:
+            continue
         
-        # Skip the title line
-        if line.startswith('#') and (title in line or line.startswith('# ')):
-            found_title = True
-            skip_next_empty = True
+        if not title:
+            match = HEADING_RE.match(line) if line.startswith('#') else None
+            if match:
+                title = match.group(1).strip()
+            elif not first_line and not line.startswith(('#', '<')):
+                first_line = line[:100]
             continue
         
-        # Skip empty lines right after title
-        if skip_next_empty and not line:
+        # Skip headings, code blocks, images (including <picture> markup), and other non-text content
+        if line.startswith(('#', '```', '![', '>', '<')):
             continue
-        skip_next_empty = False
         
-        # Once we've found the title, look for the first good paragraph
-        if found_title and line:
-            # Skip headings (but continue looking)
-            if line.startswith('#'):
-                continue
-            
-            # Skip code blocks, images, and other non-text content
-            if line.startswith('```') or line.startswith('![') or line.startswith('>'):
-                continue
-            
-            # Skip very short lines that are likely formatting or list items
-            if len(line) < 15:
-                # But include if it looks like a sentence
-                if not (line.endswith('.') or line.endswith('!') or line.endswith('?')):
-                    continue
-            
-            # Skip list markers at start
-            if re.match(r'^[-*+]\s+', line):
-                line = re.sub(r'^[-*+]\s+', '', line)
-            
-            # Skip numbered list markers
-            if re.match(r'^\d+\.\s+', line):
-                line = re.sub(r'^\d+\.\s+', '', line)
+        # Skip very short lines that are likely formatting or list items, unless they look like a sentence
+        if len(line) < 15 and not line.endswith(('.', '!', '?')):
+            continue
+        
+        # Drop bullet and numbered list markers
+        line = NUMBER_MARKER_RE.sub('', BULLET_MARKER_RE.sub('', line, count=1), count=1)
+        
+        if len(line) >= 20:  # Minimum length for a meaningful sentence
+            description_lines.append(line)
+            found_paragraph = True
             
-            # This looks like a good paragraph line
-            if len(line) >= 20:  # Minimum length for a meaningful sentence
-                description_lines.append(line)
-                found_paragraph = True
-                
-                # Stop if we have enough content (around 150-200 chars)
-                current_desc = ' '.join(description_lines)
-                if len(current_desc) > 150:
-                    # Try to end at sentence boundary
-                    sentences = re.split(r'[.!?]\s+', current_desc)
-                    if len(sentences) > 1:
-                        description_lines = [sentences[0] + '.']
-                        if len(sentences) > 1 and len(description_lines[0]) < 100:
-                            description_lines.append(sentences[1] + '.')
-                    break
-            elif found_paragraph:
-                # We already found a paragraph, stop at next empty line or heading
+            # Stop if we have enough content (around 150-200 chars)
+            current_desc = ' '.join(description_lines)
+            if len(current_desc) > 150:
+                # Try to end at sentence boundary
+                sentences = SENTENCE_END_RE.split(current_desc)
+                if len(sentences) > 1:
+                    description_lines = [sentences[0] + '.']
+                    if len(description_lines[0]) < 100:
+                        description_lines.append(sentences[1] + '.')
                 break
+        elif found_paragraph:
+            # A short line ends the paragraph
+            break
     
-    description = ' '.join(description_lines).strip()
+    # If no heading found, use the first line of text
+    title = title or first_line
     
     # Clean up description (remove markdown formatting, limit length)
-    description = re.sub(r'\*\*(.+?)\*\*', r'\1', description)  # Remove bold
-    description = re.sub(r'\*(.+?)\*', r'\1', description)  # Remove italic
-    description = re.sub(r'`(.+?)`', r'\1', description)  # Remove code
-    description = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', description)  # Remove links, keep text
-    
-    # Fix double periods
-    description = re.sub(r'\.\.+', '...', description)
+    description = ' '.join(description_lines).strip()
+    for pattern, replacement in MARKDOWN_CLEANUP:
+        description = pattern.sub(replacement, description)
     
     # Limit description length
     if len(description) > 200:
         # Try to cut at sentence boundary
-        sentences = re.split(r'[.!?]\s+', description)
+        sentences = SENTENCE_END_RE.split(description)
         description = sentences[0]
         if len(sentences) > 1 and len(description) < 50:
             description += '. ' + sentences[1]
@@ -162,6 +150,11 @@ def extract_title_and_description(markdown_content: str) -> tuple[str, str]:
     return title, description
 
 
+def extract_title_and_description(markdown_content: str) -> tuple[str, str]:
+    """Extract title and description from the top of markdown content"""
+    return extract_title_and_description_from_lines(markdown_content[:EXTRACT_MAX_CHARS].splitlines())
+
+
 def get_icon_for_article(title: str, filename: str) -> str:
     """Determine the appropriate icon for an article based on title and filename"""
     text_to_check = (title + ' ' + filename).lower()
@@ -214,13 +207,99 @@ def get_category_icon(category: str) -> str:
         return 'fas fa-file-alt'
 
 
-def scan_articles() -> List[Dict[str, str]]:
-    """Scan articles directory and extract metadata - only process articles that exist in Notion metadata"""
-    articles = []
+# Markdown syntax that is not read as words: link/image targets and formatting characters
+MARKDOWN_LINK_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+MARKDOWN_SYNTAX_RE = re.compile(r'^\s*(?:#+|[-*+]|\d+\.|>|\|)\s+|[*_`~|]+', re.MULTILINE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def count_words(markdown_content: str) -> int:
+    """Words a reader sees in the rendered article (link text counts, URLs and markup don't)"""
+    # HTML tags first: <picture>/<source> attributes (srcset URLs, sizes, type) are not words
+    text = HTML_TAG_RE.sub(' ', markdown_content)
+    text = MARKDOWN_LINK_RE.sub(r'\1', text)
+    text = MARKDOWN_SYNTAX_RE.sub(' ', text)
+    return len(text.split())
+
+
+def reading_minutes(word_count: int) -> int:
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+def build_article_row(md_file: Path, notion_data: Dict[str, any], content: str) -> Dict[str, any]:
+    """Article index row for one markdown file and its Notion metadata"""
+    # Use Title and Excerpt from Notion metadata
+    title = notion_data.get('title')
+    description = notion_data.get('excerpt')  # Use 'excerpt' instead of 'description'
+    
+    # Fallback: extract from markdown if Notion metadata not available
+    if not title or not description:
+        extracted_title, extracted_description = extract_title_and_description(content)
+        title = title or extracted_title
+        description = description or extracted_description
+    
+    # Determine icon - prefer category from Notion, fallback to title/filename
+    category = notion_data.get('category') or notion_data.get('categories')
+    if isinstance(category, list):
+        category = category[0] if category else None
+    icon = get_category_icon(category) if category else get_icon_for_article(title, md_file.name)
+    word_count = count_words(content)
     
+    return {
+        'name': md_file.name,
+        'notion_id': notion_data.get('id'),
+        'title': title,
+        'description': description,
+        'icon': icon,
+        'category': category,
+        'ready': notion_data.get('ready'),
+        'published': notion_data.get('published'),
+        'published_date': notion_data.get('published_date'),
+        'created_time': notion_data.get('created_time'),
+        'last_edited_time': notion_data.get('last_edited_time'),
+        'word_count': word_count,
+        'reading_minutes': reading_minutes(word_count),
+        'toc': json.dumps(table_of_contents(content), ensure_ascii=False),
+    }
+
+
+def sidecar_file(name: str) -> Path:
+    """Sidecar of an article, e.g. new-blog.md -> data/articles/new-blog.json"""
+    return SIDECAR_DIR / f"{Path(name).stem}.json"
+
+
+def write_sidecar(row: Dict[str, any]) -> bool:
+    """Write an article's sidecar from its index row. Returns True if the file changed."""
+    sidecar = {
+        'hash': row['file_hash'],
+        'word_count': row['word_count'],
+        'reading_minutes': row['reading_minutes'],
+        'toc': json.loads(row['toc']),
+    }
+    return write_json_if_changed(sidecar_file(row['name']), sidecar)
+
+
+def prune_sidecars(names: Iterable[str]) -> int:
+    """Delete sidecars of articles that are no longer indexed. Returns how many were deleted."""
+    keep = {sidecar_file(name).name for name in names}
+    removed = 0
+    for sidecar in SIDECAR_DIR.glob("*.json"):
+        if sidecar.name not in keep:
+            sidecar.unlink()
+            removed += 1
+    return removed
+
+
+def update_article_index(index: ArticleIndex) -> int:
+    """Bring the article index in line with articles/ and the Notion metadata - only articles that exist in Notion metadata.
+
+    Files whose size and mtime match the index are not read; others are hashed, and
+    rows are only rebuilt when the file hash or the article's metadata changed.
+    Returns the number of indexed articles.
+    """
     if not ARTICLES_DIR.exists():
         print(f"⚠️  Articles directory not found: {ARTICLES_DIR}")
-        return articles
+        return 0
     
     # Load Notion metadata if available
     notion_metadata = load_notion_metadata()
@@ -229,16 +308,14 @@ def scan_articles() -> List[Dict[str, str]]:
     # This ensures we only include articles that were exported (i.e., Ready = true)
     if not notion_metadata:
         print("⚠️  No Notion metadata found. Only processing articles with metadata.")
-        return articles
-    
-    # Get all markdown files, but only process those in metadata
-    md_files = sorted(ARTICLES_DIR.glob("*.md"), key=lambda p: p.stat().st_mtime, reverse=True)
+        return 0
     
-    for md_file in md_files:
+    indexed = []
+    unchanged = 0
+    for md_file in ARTICLES_DIR.glob("*.md"):
         try:
             # Check if we have Notion metadata for this file
-            file_key = md_file.name
-            notion_data = notion_metadata.get(file_key, {})
+            notion_data = notion_metadata.get(md_file.name, {})
             
             # Skip articles that don't have Notion metadata (weren't exported)
             if not notion_data:
@@ -250,232 +327,100 @@ def scan_articles() -> List[Dict[str, str]]:
                 print(f"  ⏭️  Skipping {md_file.name} (ready=false)")
                 continue
             
-            # Use Title and Excerpt from Notion metadata
-            title = notion_data.get('title')
-            description = notion_data.get('excerpt')  # Use 'excerpt' instead of 'description'
-            
-            # Fallback: extract from markdown if Notion metadata not available
-            if not title or not description:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                extracted_title, extracted_description = extract_title_and_description(content)
-                title = title or extracted_title
-                description = description or extracted_description
-            
-            # Get relative filename
-            filename = f"articles/{md_file.name}"
-            
-            # Determine icon - prefer category from Notion, fallback to title/filename
-            icon = 'fas fa-file-alt'
-            category = notion_data.get('category') or notion_data.get('categories')
-            if category:
-                if isinstance(category, list):
-                    category = category[0] if category else None
-                icon = get_category_icon(category)
-            else:
-                icon = get_icon_for_article(title, md_file.name)
-            
-            # Build article object
-            article = {
-                'filename': filename,
-                'title': title,
-                'description': description,
-                'icon': icon
-            }
-            
-            # Add category if available
-            if category:
-                article['category'] = category if isinstance(category, str) else (category[0] if category else None)
-            
-            # Add published status
-            if notion_data.get('published') is not None:
-                article['published'] = notion_data['published']
-            
-            # Add published_date if available
-            if notion_data.get('published_date'):
-                article['published_date'] = notion_data['published_date']
-            
-            # Add ready status (required for filtering)
-            if notion_data.get('ready') is not None:
-                article['ready'] = notion_data['ready']
+            indexed.append(md_file.name)
+            stat = md_file.stat()
+            metadata_hash = content_hash(json.dumps(notion_data, sort_keys=True).encode('utf-8'))
+            row = index.get(md_file.name)
+            if row and row['metadata_hash'] == metadata_hash and (row['size'], row['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+                unchanged += 1
+                # Sidecars are rebuilt from the index, never by re-reading the article
+                if not sidecar_file(md_file.name).exists():
+                    write_sidecar(row)
+                continue
             
-            # Add other metadata fields that might be useful
-            if notion_data.get('created_time'):
-                article['created_time'] = notion_data['created_time']
-            if notion_data.get('last_edited_time'):
-                article['last_edited_time'] = notion_data['last_edited_time']
+            data = md_file.read_bytes()
+            file_hash = content_hash(data)
+            if row and row['metadata_hash'] == metadata_hash and row['file_hash'] == file_hash:
+                # Same content under a new mtime (e.g. a fresh checkout)
+                index.touch(md_file.name, stat.st_size, stat.st_mtime_ns)
+                unchanged += 1
+                if not sidecar_file(md_file.name).exists():
+                    write_sidecar(row)
+                continue
             
-            articles.append(article)
+            article = build_article_row(md_file, notion_data, data.decode('utf-8'))
+            article.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns, file_hash=file_hash, metadata_hash=metadata_hash)
+            categories = notion_data.get('category') or notion_data.get('categories') or []
+            index.upsert(article, categories if isinstance(categories, list) else [categories])
+            write_sidecar(article)
             
-            print(f"✓ Processed: {md_file.name} -> {title}")
+            print(f"✓ Processed: {md_file.name} -> {article['title']}")
             
         except Exception as e:
             print(f"⚠️  Error processing {md_file.name}: {e}")
             continue
     
-    return articles
+    removed = index.remove_missing(indexed)
+    prune_sidecars(indexed)
+    print(f"  🗃️  Article index: {len(indexed)} article(s), {unchanged} unchanged, {removed} removed")
+    return len(indexed)
 
 
-def escape_js_string(text: str) -> str:
-    """Escape string for JavaScript single-quoted string"""
-    # Escape backslashes first
-    text = text.replace('\\', '\\\\')
-    # Escape single quotes
-    text = text.replace("'", "\\'")
-    # Escape newlines
-    text = text.replace('\n', '\\n')
-    # Escape carriage returns
-    text = text.replace('\r', '\\r')
-    return text
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
 
-def generate_js_array(articles: List[Dict[str, str]]) -> str:
-    """Generate JavaScript array string from articles list"""
-    if not articles:
-        return "[]"
-    
-    lines = ["["]
-    for i, article in enumerate(articles):
-        comma = "," if i < len(articles) - 1 else ""
-        lines.append(f"    {{ ")
-        lines.append(f"        filename: '{escape_js_string(article['filename'])}', ")
-        lines.append(f"        title: '{escape_js_string(article['title'])}', ")
-        lines.append(f"        description: '{escape_js_string(article['description'])}', ")
-        lines.append(f"        icon: '{escape_js_string(article['icon'])}'")
-        
-        # Add optional fields
-        if article.get('category'):
-            lines.append(f", ")
-            lines.append(f"        category: '{escape_js_string(article['category'])}'")
-        if article.get('ready') is not None:
-            lines.append(f", ")
-            lines.append(f"        ready: {str(article['ready']).lower()}")
-        if article.get('published') is not None:
-            lines.append(f", ")
-            lines.append(f"        published: {str(article['published']).lower()}")
-        if article.get('published_date'):
-            lines.append(f", ")
-            lines.append(f"        published_date: '{escape_js_string(article['published_date'])}'")
-        if article.get('created_time'):
-            lines.append(f", ")
-            lines.append(f"        created_time: '{escape_js_string(article['created_time'])}'")
-        if article.get('last_edited_time'):
-            lines.append(f", ")
-            lines.append(f"        last_edited_time: '{escape_js_string(article['last_edited_time'])}'")
-        
-        lines.append(f"    }}{comma}")
-    lines.append("]")
+def write_json_if_changed(data_file: Path, data: any) -> bool:
+    """Atomically write JSON, unless the file already has the same content hash. Returns True if written.
+
+    Skipping unchanged content keeps the file, and therefore its HTTP cache validators,
+    stable between runs.
+    """
+    content = (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+    if data_file.exists() and content_hash(data_file.read_bytes()) == content_hash(content):
+        return False
     
-    return "\n".join(lines)
+    data_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = data_file.with_suffix(data_file.suffix + ".tmp")
+    with open(temp_file, 'wb') as f:
+        f.write(content)
+    os.replace(temp_file, data_file)
+    return True
 
 
-def update_js_file(file_path: Path, articles: List[Dict[str, str]], array_name: str = "articles") -> bool:
-    """Update JavaScript file with new articles array"""
-    try:
-        # Read current file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Generate new array (split into lines)
-        new_array_lines = generate_js_array(articles).split('\n')
-        
-        # Find the array declaration line and boundaries
-        array_start_idx = -1
-        array_end_idx = -1
-        bracket_count = 0
-        in_array = False
-        
-        for i, line in enumerate(lines):
-            # Check if this line starts the array declaration
-            if f'const {array_name}' in line and '=' in line:
-                array_start_idx = i
-                bracket_count = line.count('[') - line.count(']')
-                in_array = bracket_count > 0
-                continue
-            
-            # If we're in the array, count brackets
-            if in_array:
-                bracket_count += line.count('[') - line.count(']')
-                if bracket_count <= 0:
-                    array_end_idx = i
-                    in_array = False
-                    break
-        
-        if array_start_idx == -1:
-            print(f"⚠️  Could not find '{array_name}' array declaration in {file_path.name}")
-            return False
-        
-        if array_end_idx == -1:
-            print(f"⚠️  Could not find end of '{array_name}' array in {file_path.name}")
-            return False
-        
-        # Build new content
-        new_lines = []
-        
-        # Add lines before the array
-        new_lines.extend(lines[:array_start_idx])
-        
-        # Add the new array
-        # Check if the declaration line has anything after the '='
-        declaration_line = lines[array_start_idx].rstrip()
-        if '[' in declaration_line:
-            # Array starts on the same line
-            # Replace everything after '=' with the new array
-            before_equals = declaration_line.split('=')[0] + '= '
-            new_lines.append(before_equals + new_array_lines[0] + '\n')
-            new_lines.extend([line + '\n' for line in new_array_lines[1:]])
-        else:
-            # Array starts on next line
-            new_lines.append(declaration_line.rstrip() + '\n')
-            new_lines.extend([line + '\n' for line in new_array_lines])
-        
-        # Add lines after the array
-        new_lines.extend(lines[array_end_idx + 1:])
-        
-        # Write updated content
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
-        
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error updating {file_path}: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+def write_articles_data(articles: List[Dict[str, str]], data_file: Path = ARTICLES_DATA_FILE) -> bool:
+    """Write the article list the site loads if its content changed. Returns True if written."""
+    written = write_json_if_changed(data_file, articles)
+    print(f"{'✅ Wrote' if written else '✓'} {data_file.name}{'' if written else ' unchanged'}")
+    return written
 
 
 def main():
     """Main function"""
     print("📝 Generating article metadata...")
     
-    # Scan articles
-    articles = scan_articles()
+    # Update the article index; every output below is a query on it
+    with ArticleIndex() as index:
+        update_article_index(index)
+        articles = index.articles()
+        categories = index.category_counts()
     
     if not articles:
         print("⚠️  No articles found to process")
         return
     
     print(f"\n📋 Found {len(articles)} article(s)")
+    if categories:
+        print(f"🏷️  Categories: {', '.join(f'{category} ({count})' for category, count in categories.items())}")
     
-    # Update article.js
-    print(f"\n📄 Updating {ARTICLE_JS.name}...")
-    if update_js_file(ARTICLE_JS, articles):
-        print(f"✅ Updated {ARTICLE_JS.name}")
-    else:
-        print(f"❌ Failed to update {ARTICLE_JS.name}")
-        return
-    
-    # Update script.js
-    print(f"\n📄 Updating {SCRIPT_JS.name}...")
-    if update_js_file(SCRIPT_JS, articles):
-        print(f"✅ Updated {SCRIPT_JS.name}")
-    else:
-        print(f"❌ Failed to update {SCRIPT_JS.name}")
+    # script.js and article.js both load this file, so they never need rewriting
+    print(f"\n📄 Writing {ARTICLES_DATA_FILE.name}...")
+    try:
+        write_articles_data(articles)
+    except OSError as e:
+        print(f"❌ Failed to write {ARTICLES_DATA_FILE.name}: {e}")
         return
     
-    print(f"\n✅ Successfully updated article metadata in both JavaScript files!")
     print(f"📊 Articles processed: {len(articles)}")
 
 
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Image Variants - Generates resized WebP/AVIF variants of exported images
+Rewrites Markdown image references in articles to <picture>/srcset markup with
+intrinsic width/height, lazy loading and a tiny blurred placeholder
+Used as a post-download stage by export_notion.py, or run standalone over articles/
+Variants and placeholders need Pillow; dimensions are read from the file header without it
+"""
+
+import re
+import json
+import base64
+import struct
+import hashlib
+import threading
+from io import BytesIO
+from pathlib import Path
+from html import escape
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    from PIL import Image, ImageFilter, features
+except ImportError:  # Pillow is optional
+    Image = None
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+ARTICLES_DIR = ROOT_DIR / "articles"
+IMAGES_DIR = ROOT_DIR / "images"
+VARIANTS_DIR = IMAGES_DIR / "variants"
+VARIANT_INDEX_FILE = ROOT_DIR / "data" / "image_variants.json"
+IMAGE_META_FILE = ROOT_DIR / "data" / "image_meta.json"
+
+# Widths generated for each image (never larger than the original)
+VARIANT_WIDTHS = (480, 960, 1600)
+# The article column is at most ~770px wide (900px container minus padding)
+PICTURE_SIZES = "(max-width: 900px) 100vw, 770px"
+VARIANT_QUALITY = {"webp": 80, "avif": 55}
+RASTER_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+# Width of the blurred low-quality placeholder inlined as a data URI
+PLACEHOLDER_WIDTH = 16
+
+# Markdown image pointing at a local image: ![caption](images/file.ext)
+MARKDOWN_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\((images/[^)\s]+)\)')
+
+
+def variant_formats() -> List[str]:
+    """Output formats supported by the installed Pillow, best first"""
+    if Image is None:
+        return []
+    formats = []
+    if features.check("avif"):
+        formats.append("avif")
+    if features.check("webp"):
+        formats.append("webp")
+    return formats
+
+
+def file_content_hash(file_path: Path) -> str:
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class VariantIndex:
+    """Persistent content hash -> {width, height, variants} cache, so each image is resized once"""
+
+    def __init__(self, index_file: Path = VARIANT_INDEX_FILE):
+        self.index_file = index_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if index_file.exists():
+            try:
+                with open(index_file, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️  Warning: Could not load image variant index: {e}")
+
+    def get(self, image_path: Path) -> Optional[Dict[str, Any]]:
+        """Variants for an image, generating any that are missing. None if the image can't be processed."""
+        if Image is None or image_path.suffix.lower() not in RASTER_EXTENSIONS or not image_path.exists():
+            return None
+        content_hash = file_content_hash(image_path)
+        with self._lock:
+            entry = self.entries.get(content_hash)
+        if entry and all((ROOT_DIR / src).exists() for sources in entry["variants"].values() for _, src in sources):
+            return entry
+        entry = generate_variants(image_path, content_hash)
+        if entry:
+            with self._lock:
+                self.entries[content_hash] = entry
+        return entry
+
+    def save(self):
+        with self._lock:
+            entries = dict(self.entries)
+        try:
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save image variant index: {e}")
+
+
+def generate_variants(image_path: Path, content_hash: str) -> Optional[Dict[str, Any]]:
+    """Resize an image to VARIANT_WIDTHS in every supported format. Returns its index entry."""
+    formats = variant_formats()
+    if not formats:
+        return None
+    try:
+        VARIANTS_DIR.mkdir(exist_ok=True)
+        with Image.open(image_path) as im:
+            im.load()
+            width, height = im.size
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "A" in im.getbands() else "RGB")
+            widths = sorted({w for w in VARIANT_WIDTHS if w < width} | {min(width, max(VARIANT_WIDTHS))})
+            variants = {fmt: [] for fmt in formats}
+            for target_width in widths:
+                target_height = max(1, round(height * target_width / width))
+                resized = im if target_width == width else im.resize((target_width, target_height), Image.LANCZOS)
+                for fmt in formats:
+                    name = f"{content_hash[:12]}-{target_width}.{fmt}"
+                    out_path = VARIANTS_DIR / name
+                    if not out_path.exists():
+                        tmp_path = out_path.with_suffix(f".{fmt}.part")
+                        resized.save(tmp_path, format=fmt.upper(), quality=VARIANT_QUALITY[fmt])
+                        tmp_path.replace(out_path)
+                    variants[fmt].append([target_width, f"images/variants/{name}"])
+        print(f"  🖼️  Generated {sum(len(v) for v in variants.values())} variant(s) for {image_path.name}")
+        return {"width": width, "height": height, "variants": variants}
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not generate variants for {image_path.name}: {e}")
+        return None
+
+
+def read_image_size(image_path: Path) -> Optional[Tuple[int, int]]:
+    """Read (width, height) from a PNG, GIF, JPEG or WebP header without decoding the image"""
+    try:
+        with open(image_path, "rb") as f:
+            head = f.read(32)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+                return struct.unpack(">II", head[16:24])
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", head[6:10])
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                chunk = head[12:16]
+                if chunk == b"VP8X":
+                    width = int.from_bytes(head[24:27], "little") + 1
+                    height = int.from_bytes(head[27:30], "little") + 1
+                    return width, height
+                if chunk == b"VP8L":
+                    bits = int.from_bytes(head[21:25], "little")
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b"VP8 ":
+                    frame = head + f.read(32)
+                    width, height = struct.unpack("<HH", frame[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                return None
+            if head[:2] == b"\xff\xd8":
+                # Walk JPEG segments until a start-of-frame marker
+                f.seek(2)
+                while True:
+                    marker = f.read(2)
+                    if len(marker) < 2 or marker[0] != 0xFF:
+                        return None
+                    if marker[1] in (0xD8, 0x01) or 0xD0 <= marker[1] <= 0xD7:
+                        continue
+                    length = struct.unpack(">H", f.read(2))[0]
+                    if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                        height, width = struct.unpack(">xHH", f.read(5))
+                        return width, height
+                    f.seek(length - 2, 1)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+def has_transparency(image_path: Path) -> Optional[bool]:
+    """Whether an image has an alpha channel or a transparent palette colour. None without Pillow."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(image_path) as im:
+            return im.mode in ("RGBA", "LA", "PA", "RGBa", "La") or "transparency" in im.info
+    except Exception:
+        return None
+
+
+def make_placeholder(image_path: Path) -> Optional[str]:
+    """Tiny blurred WebP of the image as a data URI (LQIP). None without Pillow."""
+    if Image is None or not features.check("webp"):
+        return None
+    try:
+        with Image.open(image_path) as im:
+            im.draft("RGB", (PLACEHOLDER_WIDTH * 4, PLACEHOLDER_WIDTH * 4))
+            im = im.convert("RGB")
+            height = max(1, round(im.height * PLACEHOLDER_WIDTH / im.width))
+            small = im.resize((PLACEHOLDER_WIDTH, height), Image.BILINEAR).filter(ImageFilter.GaussianBlur(1))
+            buffer = BytesIO()
+            small.save(buffer, format="WEBP", quality=30)
+        return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+    except Exception as e:
+        print(f"  ⚠️  Warning: Could not build placeholder for {image_path.name}: {e}")
+        return None
+
+
+class ImageMetaIndex:
+    """Persistent sidecar of image filename -> {bytes, width, height, transparent, placeholder}.
+
+    Image files are immutable once downloaded, so each header is read once; the
+    recorded byte size guards against a file being replaced under the same name.
+    Transparent images get no placeholder: it would show through them once loaded.
+    """
+
+    def __init__(self, index_file: Path = IMAGE_META_FILE):
+        self.index_file = index_file
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if index_file.exists():
+            try:
+                with open(index_file, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except Exception as e:
+                print(f"⚠️  Warning: Could not load image metadata index: {e}")
+
+    def get(self, image_path: Path) -> Optional[Dict[str, Any]]:
+        """Dimensions and placeholder for an image, reading the file only if not cached"""
+        try:
+            size = image_path.stat().st_size
+        except OSError:
+            return None
+        with self._lock:
+            entry = self.entries.get(image_path.name)
+        # Entries from before transparency was recorded are checked again
+        if entry and entry.get("bytes") == size and (Image is None or "transparent" in entry and (entry["transparent"] or entry.get("placeholder"))):
+            return entry
+        dimensions = read_image_size(image_path)
+        if not dimensions:
+            return None
+        entry = {"bytes": size, "width": dimensions[0], "height": dimensions[1]}
+        transparent = has_transparency(image_path)
+        if transparent is not None:
+            entry["transparent"] = transparent
+        placeholder = make_placeholder(image_path) if not transparent else None
+        if placeholder:
+            entry["placeholder"] = placeholder
+        with self._lock:
+            self.entries[image_path.name] = entry
+        return entry
+
+    def save(self):
+        with self._lock:
+            entries = dict(self.entries)
+        try:
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+        except Exception as e:
+            print(f"⚠️  Warning: Could not save image metadata index: {e}")
+
+
+def img_tag(src: str, alt: str, meta: Optional[Dict[str, Any]]) -> str:
+    """<img> with intrinsic size, lazy loading and the blurred placeholder as background"""
+    attributes = [f'src="{src}"', f'alt="{escape(alt)}"']
+    if meta:
+        attributes.append(f'width="{meta["width"]}" height="{meta["height"]}"')
+        if meta.get("placeholder"):
+            attributes.append(f'style="background: url({meta["placeholder"]}) center / cover no-repeat"')
+    attributes.append('loading="lazy" decoding="async"')
+    return f"<img {' '.join(attributes)}>"
+
+
+def picture_markup(src: str, alt: str, entry: Dict[str, Any], meta: Optional[Dict[str, Any]] = None) -> str:
+    """<picture> element with one srcset per variant format and the original as fallback"""
+    lines = ["<picture>"]
+    for fmt, sources in entry["variants"].items():
+        srcset = ", ".join(f"{path} {width}w" for width, path in sources)
+        lines.append(f'<source type="image/{fmt}" srcset="{srcset}" sizes="{PICTURE_SIZES}">')
+    lines.append(img_tag(src, alt, meta))
+    lines.append("</picture>")
+    # No blank lines inside, so Markdown keeps it as a single raw HTML block
+    return "\n".join(lines)
+
+
+def apply_image_markup(markdown: str, variant_index: "VariantIndex", meta_index: ImageMetaIndex) -> str:
+    """Replace ![caption](images/x) references with <picture> (when variants exist) or sized <img> markup"""
+    def replace(match: re.Match) -> str:
+        alt, src = match.group(1), match.group(2)
+        image_path = ROOT_DIR / src
+        meta = meta_index.get(image_path)
+        entry = variant_index.get(image_path)
+        if entry:
+            return picture_markup(src, alt, entry, meta)
+        return img_tag(src, alt, meta) if meta else match.group(0)
+    return MARKDOWN_IMAGE_RE.sub(replace, markdown)
+
+
+def process_markdown_files(md_files: List[Path], variant_index: Optional["VariantIndex"] = None, meta_index: Optional[ImageMetaIndex] = None) -> int:
+    """Generate variants and metadata for the images in the given files and rewrite their markup. Returns files changed."""
+    if Image is None:
+        print("⚠️  Pillow not installed, emitting sized <img> tags without variants or placeholders")
+    variant_index = variant_index or VariantIndex()
+    meta_index = meta_index or ImageMetaIndex()
+    changed = 0
+    for md_file in md_files:
+        try:
+            content = md_file.read_text(encoding="utf-8")
+            updated = apply_image_markup(content, variant_index, meta_index)
+            if updated != content:
+                md_file.write_text(updated, encoding="utf-8")
+                changed += 1
+        except Exception as e:
+            print(f"  ⚠️  Warning: Could not process images in {md_file.name}: {e}")
+    variant_index.save()
+    meta_index.save()
+    return changed
+
+
+def main():
+    """Main function"""
+    print("🖼️  Generating responsive image variants...")
+    changed = process_markdown_files(sorted(ARTICLES_DIR.glob("*.md")))
+    print(f"✅ Updated {changed} article(s)")
+
+
+if __name__ == "__main__":
+    main()
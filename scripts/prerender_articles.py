@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Prerender Articles - Renders articles/*.md to sanitized HTML fragments at build time
+Writes data/articles/<article>.html, which article.html shows directly instead of fetching
+and parsing the markdown with marked; code blocks are highlighted with Pygments
+Each fragment records the hash of its source, so only changed articles are re-rendered
+h2/h3 headings get "heading-<n>" ids, the anchors of the sidecar table of contents
+Needs markdown-it-py, Pygments and nh3; without them the site keeps rendering in the browser
+"""
+
+import os
+import re
+import hashlib
+from html import escape
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import nh3
+    from markdown_it import MarkdownIt
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:  # Pre-rendering is optional
+    MarkdownIt = None
+
+# Configuration
+ROOT_DIR = Path(__file__).parent.parent
+ARTICLES_DIR = ROOT_DIR / "articles"
+# Next to the per-article sidecars written by generate_article_metadata.py
+FRAGMENTS_DIR = ROOT_DIR / "data" / "articles"
+HIGHLIGHT_CSS_FILE = ROOT_DIR / "data" / "highlight.css"
+# Pygments theme matching the site's code colours
+HIGHLIGHT_STYLE = "dracula"
+# Bump to re-render every article (e.g. after changing the renderer or sanitizer settings)
+PRERENDER_VERSION = 2
+
+# First line of every fragment: <!-- source <hash> -->
+SOURCE_HASH_RE = re.compile(r'^<!-- source ([0-9a-f]{64}) -->')
+
+# Markup the exporter and image_variants.py emit on top of plain Markdown
+EXTRA_TAGS = {"picture", "source", "input"}
+EXTRA_ATTRIBUTES = {
+    "img": {"loading", "decoding", "style", "title"},
+    "source": {"type", "srcset", "sizes"},
+    "a": {"title"},
+    "h2": {"id"},
+    "h3": {"id"},
+    "code": {"class"},
+    "pre": {"class"},
+    "span": {"class"},
+    "th": {"style"},
+    "td": {"style"},
+    "input": {"type", "checked", "disabled"},
+}
+
+
+def highlight_code(code: str, lang: str, attrs: Optional[str] = None) -> str:
+    """Pygments markup for a fenced code block (markdown-it escapes it plainly if this returns "")"""
+    try:
+        lexer = get_lexer_by_name(lang) if lang else None
+    except ClassNotFound:
+        lexer = None
+    if lexer is None:
+        return ""
+    spans = highlight(code, lexer, HtmlFormatter(nowrap=True))
+    return f'<pre class="highlight"><code class="language-{escape(lang)}">{spans}</code></pre>\n'
+
+
+def create_renderer() -> "MarkdownIt":
+    """CommonMark with tables and strikethrough, as marked renders the articles"""
+    return MarkdownIt("commonmark", {"html": True, "highlight": highlight_code}).enable(["table", "strikethrough"])
+
+
+def anchor_headings(tokens: List[Any]) -> List[Dict[str, Any]]:
+    """Give every h2/h3 heading token an id and return the article's heading tree.
+
+    Ids are "heading-<n>", numbering h2 and h3 together in document order; h3s nest
+    under the preceding h2. Only headings markdown-it actually renders are included.
+    """
+    toc = []
+    position = 0
+    for index, token in enumerate(tokens):
+        if token.type != "heading_open" or token.tag not in ("h2", "h3"):
+            continue
+        entry_id = f"heading-{position}"
+        position += 1
+        token.attrSet("id", entry_id)
+        inline = tokens[index + 1]
+        text = "".join(child.content for child in inline.children or [] if child.type in ("text", "code_inline"))
+        entry = {"id": entry_id, "text": text.strip(), "level": int(token.tag[1])}
+        if entry["level"] == 3 and toc and toc[-1]["level"] == 2:
+            toc[-1].setdefault("children", []).append(entry)
+        else:
+            toc.append(entry)
+    return toc
+
+
+def table_of_contents(markdown: str) -> List[Dict[str, Any]]:
+    """Heading tree of an article for its sidecar, matching the ids of the rendered fragment ([] without markdown-it)"""
+    if MarkdownIt is None:
+        return []
+    return anchor_headings(create_renderer().parse(markdown))
+
+
+def render_article(renderer: "MarkdownIt", markdown: str) -> str:
+    """Sanitized HTML of an article, with ids on its h2/h3 headings"""
+    tokens = renderer.parse(markdown)
+    anchor_headings(tokens)
+    return sanitize(renderer.renderer.render(tokens, renderer.options, {}))
+
+
+def sanitize(html: str) -> str:
+    """Strip scripts, event handlers and unknown markup from a rendered article"""
+    attributes: Dict[str, set] = {tag: set(allowed) for tag, allowed in nh3.ALLOWED_ATTRIBUTES.items()}
+    for tag, allowed in EXTRA_ATTRIBUTES.items():
+        attributes[tag] = attributes.get(tag, set()) | allowed
+    return nh3.clean(html, tags=nh3.ALLOWED_TAGS | EXTRA_TAGS, attributes=attributes)
+
+
+def source_hash(markdown: bytes) -> str:
+    return hashlib.sha256(f"v{PRERENDER_VERSION}:".encode("utf-8") + markdown).hexdigest()
+
+
+def rendered_hash(fragment_file: Path) -> Optional[str]:
+    """Source hash recorded in an existing fragment"""
+    try:
+        with open(fragment_file, "r", encoding="utf-8") as f:
+            match = SOURCE_HASH_RE.match(f.readline())
+        return match.group(1) if match else None
+    except OSError:
+        return None
+
+
+def write_highlight_css():
+    """Pygments stylesheet for the highlighted code blocks, rewritten only when it changes"""
+    css = HtmlFormatter(style=HIGHLIGHT_STYLE).get_style_defs(".article-content pre.highlight") + "\n"
+    if HIGHLIGHT_CSS_FILE.exists() and HIGHLIGHT_CSS_FILE.read_text(encoding="utf-8") == css:
+        return
+    HIGHLIGHT_CSS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    HIGHLIGHT_CSS_FILE.write_text(css, encoding="utf-8")
+    print(f"✅ Wrote {HIGHLIGHT_CSS_FILE.name}")
+
+
+def prerender_articles() -> int:
+    """Render every article whose source hash changed and delete fragments of removed articles. Returns articles rendered."""
+    renderer = create_renderer()
+    FRAGMENTS_DIR.mkdir(parents=True, exist_ok=True)
+    rendered = 0
+    unchanged = 0
+    names = set()
+
+    for md_file in sorted(ARTICLES_DIR.glob("*.md")):
+        fragment_file = FRAGMENTS_DIR / f"{md_file.stem}.html"
+        names.add(fragment_file.name)
+        try:
+            markdown = md_file.read_bytes()
+            digest = source_hash(markdown)
+            if rendered_hash(fragment_file) == digest:
+                unchanged += 1
+                continue
+
+            html = render_article(renderer, markdown.decode("utf-8"))
+            temp_file = fragment_file.with_suffix(".html.tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(f"<!-- source {digest} -->\n{html}")
+            os.replace(temp_file, fragment_file)
+            rendered += 1
+            print(f"✓ Rendered: {md_file.name}")
+        except Exception as e:
+            print(f"⚠️  Error rendering {md_file.name}: {e}")
+
+    removed = 0
+    for fragment_file in FRAGMENTS_DIR.glob("*.html"):
+        if fragment_file.name not in names:
+            fragment_file.unlink()
+            removed += 1
+
+    print(f"  🖨️  Pre-rendered {rendered} article(s), {unchanged} unchanged, {removed} removed")
+    return rendered
+
+
+def main():
+    """Main function"""
+    print("🖨️  Pre-rendering articles...")
+    if MarkdownIt is None:
+        print("⚠️  markdown-it-py, Pygments or nh3 not installed, articles will be rendered in the browser")
+        return
+    write_highlight_css()
+    prerender_articles()
+
+
+if __name__ == "__main__":
+    main()
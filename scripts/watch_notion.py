@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Notion Watcher - Long-running watch mode for export_notion.py
+Polls Notion search (newest edits first) past a high-water mark, waits for a burst of
+edits to settle, then runs an incremental export and regenerates the article metadata
+Polling costs one search request per interval while nothing changes
+"""
+
+import os
+import time
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+import export_notion
+import generate_article_metadata
+import prerender_articles
+from export_notion import (
+    SEARCH_NEWEST_FIRST,
+    SEARCH_PAGES_FILTER,
+    find_database_in_page,
+    get_notion_client,
+    normalize_notion_id,
+    get_page_title,
+)
+
+# Configuration
+# Seconds between change-feed polls
+WATCH_INTERVAL = float(os.getenv("WATCH_INTERVAL", "10"))
+# Export once no new edits arrived for this many seconds
+WATCH_DEBOUNCE = float(os.getenv("WATCH_DEBOUNCE", "30"))
+# Search results per poll; more are fetched only while every result is new
+WATCH_PAGE_SIZE = int(os.getenv("WATCH_PAGE_SIZE", "10"))
+
+
+class ChangeFeed:
+    """Pages edited since the last poll, read from search sorted by last_edited_time.
+
+    Notion timestamps have minute precision, so the feed keeps every (id, time) pair
+    seen at the high-water mark and treats only unseen pairs at that minute as new.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.high_water: Optional[str] = None
+        self.seen_at_mark: Set[Tuple[str, str]] = set()
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Pages edited since the previous poll (the first poll only sets the mark)"""
+        first_poll = self.high_water is None
+        changed = []
+        cursor = None
+
+        while True:
+            kwargs = {"filter": SEARCH_PAGES_FILTER, "sort": SEARCH_NEWEST_FIRST, "page_size": WATCH_PAGE_SIZE}
+            if cursor:
+                kwargs["start_cursor"] = cursor
+            response = self.client.search(**kwargs)
+
+            reached_mark = False
+            for page in response.get("results", []):
+                edited = page.get("last_edited_time", "")
+                if self.high_water and (edited < self.high_water or (page.get("id"), edited) in self.seen_at_mark):
+                    reached_mark = True
+                    break
+                changed.append(page)
+
+            if reached_mark or first_poll or not response.get("has_more"):
+                break
+            cursor = response.get("next_cursor")
+
+        if changed:
+            newest = changed[0].get("last_edited_time", "")
+            if newest != self.high_water:
+                self.high_water = newest
+                self.seen_at_mark = set()
+            self.seen_at_mark.update((page.get("id"), newest) for page in changed if page.get("last_edited_time") == newest)
+
+        if self.high_water is None:
+            # Empty workspace: start from now
+            self.high_water = time.strftime("%Y-%m-%dT%H:%M:00.000Z", time.gmtime())
+        return [] if first_poll else changed
+
+
+def resolve_target(client: Any) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """(database id, parent page id, explicit page ids) the exporter will publish, from the same env vars
+    Ids are normalized to the dashed form the API uses in parent and id fields"""
+    database_id = normalize_notion_id(os.getenv("DATABASE_ID", ""))
+    page_ids = [normalize_notion_id(pid) for pid in os.getenv("PAGE_ID", "").split(",") if pid.strip()]
+    if database_id:
+        return database_id, None, []
+    if not page_ids:
+        raise ValueError("Either DATABASE_ID or PAGE_ID environment variable is required")
+    database_id = find_database_in_page(page_ids[0], client)
+    if database_id:
+        return database_id, None, []
+    if len(page_ids) > 1:
+        return None, None, page_ids
+    return None, page_ids[0], []
+
+
+def is_published_page(page: Dict[str, Any], database_id: Optional[str], parent_page_id: Optional[str], page_ids: List[str]) -> bool:
+    """Whether an edited page belongs to what the exporter publishes"""
+    parent = page.get("parent") or {}
+    if database_id:
+        return parent.get("database_id") == database_id
+    if parent_page_id:
+        return parent.get("page_id") == parent_page_id
+    return page.get("id") in page_ids
+
+
+def publish():
+    """Export the changed pages, regenerate the article metadata and re-render the changed articles"""
+    # Database exports skip every page whose last_edited_time matches the manifest
+    export_notion.EXPORT_MODE = "incremental"
+    export_notion.main()
+    generate_article_metadata.main()
+    prerender_articles.main()
+
+
+def main():
+    """Main function"""
+    print("👀 Notion watcher starting...")
+    client = get_notion_client()
+    database_id, parent_page_id, page_ids = resolve_target(client)
+    feed = ChangeFeed(client)
+
+    # Catch up on anything edited while the watcher was not running
+    feed.poll()
+    publish()
+    print(f"👀 Watching for edits every {WATCH_INTERVAL:g}s (debounce {WATCH_DEBOUNCE:g}s, mark {feed.high_water})")
+
+    pending: Dict[str, str] = {}
+    last_change = 0.0
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        try:
+            changed = [page for page in feed.poll() if is_published_page(page, database_id, parent_page_id, page_ids)]
+        except Exception as e:
+            print(f"⚠️  Warning: Could not poll Notion: {e}")
+            continue
+
+        for page in changed:
+            pending[page["id"]] = get_page_title(page)
+            print(f"  ✏️  Edited: {pending[page['id']]} ({page.get('last_edited_time')})")
+        if changed:
+            last_change = time.monotonic()
+
+        if pending and time.monotonic() - last_change >= WATCH_DEBOUNCE:
+            print(f"\n🚀 Publishing {len(pending)} edited page(s)...")
+            try:
+                publish()
+            except Exception as e:
+                print(f"❌ Export failed, retrying after the next poll: {e}")
+                continue
+            pending.clear()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n👋 Watcher stopped")